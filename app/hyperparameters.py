@@ -13,4 +13,13 @@ OPTIMIZATION_WEIGHTS = {
 }
 
 # Time limit for the solver in minutes
-SOLVER_TIME_LIMIT = 1
\ No newline at end of file
+SOLVER_TIME_LIMIT = 1
+
+# Number of parallel solver workers. None uses one per CPU core (up to 16).
+# Lower it to leave cores free for other programs while the scheduler runs.
+NUM_SEARCH_WORKERS = None
+
+# Start the search from the last successful schedule (saved as last_schedule.pkl after
+# every run whose schedule passes all the checks). Useful when re-running after small
+# changes to the data or the weights.
+WARM_START_FROM_LAST_SCHEDULE = False
@@ -15,19 +15,15 @@ def test_staff_non_overlap(schedule_df):
     """
     violations = []
 
-    # Group by (time_slot, staff) to find all assignments for eac
-    # h staff in each time slot
-    grouped = schedule_df.groupby(["time_slot", "staff"], observed=False)
+    # Distinct (group, activity) assignments of each staff member in each time slot
+    distinct_acts = schedule_df[["time_slot", "staff", "group", "activity"]].drop_duplicates()
 
-    for (ts, staff), sub_df in grouped:
-        # Find all distinct group/activity combinations this staff is assigned to in this time slot
-        distinct_acts = sub_df[["group", "activity"]].drop_duplicates()
-        
-        # If more than one distinct assignment exists, this is a violation
-        if len(distinct_acts) > 1:
-            # Record the specific conflicting assignments
-            counts = distinct_acts.value_counts().to_dict()
-            violations.append((ts, staff, counts))
+    # Only (time_slot, staff) pairs with more than one distinct assignment are violations,
+    # so just those are grouped to report the specific conflicting assignments
+    multiple = distinct_acts.duplicated(subset=["time_slot", "staff"], keep=False)
+    for (ts, staff), sub_df in distinct_acts[multiple].groupby(["time_slot", "staff"], observed=True):
+        counts = sub_df[["group", "activity"]].value_counts().to_dict()
+        violations.append((ts, staff, counts))
 
     return violations
 
@@ -48,19 +44,16 @@ def test_location_non_overlap(schedule_df):
     # Exclude placeholder location "NA" (used for special activities like inspection)
     schedule_df = schedule_df[schedule_df["location"] != "NA"]
 
-    # Group by (time_slot, location) to find all assignments for each location in each time slot
-    grouped = schedule_df.groupby(["time_slot", "location"], observed=False)
-
-    for (ts, loc), sub_df in grouped:
-        # Find distinct group/activity combinations assigned to this location in this time slot
-        # (Multiple staff may be assigned to the same activity, so we need to find unique combinations)
-        distinct_assignments = sub_df[["group","activity"]].drop_duplicates()
+    # Distinct (group, activity) combinations assigned to each location in each time slot
+    # (Multiple staff may be assigned to the same activity, so we need to find unique combinations)
+    distinct_assignments = schedule_df[["time_slot", "location", "group", "activity"]].drop_duplicates()
 
-        # If more than one distinct assignment exists, this is a violation
-        if len(distinct_assignments) > 1:
-            # Record the specific conflicting assignments
-            combos = distinct_assignments.value_counts().to_dict()
-            violations.append((ts, loc, combos))
+    # Only (time_slot, location) pairs with more than one distinct assignment are violations,
+    # so just those are grouped to report the specific conflicting assignments
+    multiple = distinct_assignments.duplicated(subset=["time_slot", "location"], keep=False)
+    for (ts, loc), sub_df in distinct_assignments[multiple].groupby(["time_slot", "location"], observed=True):
+        combos = sub_df[["group", "activity"]].value_counts().to_dict()
+        violations.append((ts, loc, combos))
 
     return violations
 
@@ -488,22 +481,32 @@ def test_driving_range_constraints(schedule_df, group_ids, allowed_dr_days):
             (schedule_df['activity'].str.lower() == driving_range_activity)
             ]
 
-        # 1. Check frequency: exactly two entries (Periods 1 and 2)
-        if len(dr_schedule) != 2:
+        # Staff assigned in each driving range time slot. The schedule has one row per
+        # staff member when exploded, or a list of staff per row when not.
+        staff_by_slot = {}
+        for slot, staff in zip(dr_schedule['time_slot'], dr_schedule['staff']):
+            slot_staff = staff_by_slot.setdefault(slot, set())
+            if isinstance(staff, list):
+                slot_staff.update(staff)
+            else:
+                slot_staff.add(staff)
+
+        # 1. Check frequency: exactly two time slots (Periods 1 and 2)
+        if len(staff_by_slot) != 2:
             violations.append({
                 "group": g,
-                "msg": f"Expected Driving Range to be scheduled once per week (2 periods), found {len(dr_schedule)}."
+                "msg": f"Expected Driving Range to be scheduled once per week (2 periods), found {len(staff_by_slot)}."
             })
             continue  # Skip further checks for this group
 
         # 2. Check that both periods are on the same day and in Periods 1 and 2
-        days_scheduled = dr_schedule['time_slot'].apply(lambda x: x[0]).unique()
-        periods_scheduled = dr_schedule['time_slot'].apply(lambda x: x[1]).tolist()
+        days_scheduled = list(dict.fromkeys(slot[0] for slot in staff_by_slot))
+        periods_scheduled = [slot[1] for slot in staff_by_slot]
 
         if len(days_scheduled) != 1:
             violations.append({
                 "group": g,
-                "msg": f"Driving Range periods are on different days: {days_scheduled.tolist()}."
+                "msg": f"Driving Range periods are on different days: {days_scheduled}."
             })
 
         day_scheduled = days_scheduled[0]
@@ -520,15 +523,12 @@ def test_driving_range_constraints(schedule_df, group_ids, allowed_dr_days):
             })
 
         # 3. Check same staff assigned to both periods
-        staff_assigned_periods = dr_schedule['staff'].tolist()
-
-        # Convert list of lists to set of tuples for comparison
-        staff_sets = [set(staff) for staff in staff_assigned_periods]
+        staff_sets = list(staff_by_slot.values())
 
         if not all(s == staff_sets[0] for s in staff_sets):
             violations.append({
                 "group": g,
-                "msg": f"Different staff members assigned to Driving Range periods: {staff_assigned_periods}."
+                "msg": f"Different staff members assigned to Driving Range periods: {[sorted(s) for s in staff_sets]}."
             })
         else:
             # 4. Check staff count limits
@@ -1268,6 +1268,7 @@ def run_tests(schedule_df, group_ids, location_options_df, staff_off_time_slots,
     :param staff_trips: Dictionary mapping staff IDs to their trip assignments
     :param trips_df: DataFrame containing trip information
     :param leads_df: DataFrame containing lead qualification and priority
+    :return: True if every validity test passed, False otherwise
     """
 
     print("\n========================================")
@@ -1391,4 +1392,12 @@ def run_tests(schedule_df, group_ids, location_options_df, staff_off_time_slots,
     analyze_group_weekly_activity_diversity(schedule_df, activity_df)
     analyze_staff_unassigned_periods(schedule_df, staff_df, staff_off_time_slots, staff_trips, time_slots)
     if leads_df is not None:
-        analyze_lead_priority_assignments(schedule_df, staff_df, activity_df, leads_df)
\ No newline at end of file
+        analyze_lead_priority_assignments(schedule_df, staff_df, activity_df, leads_df)
+
+    return not any([
+        staff_overlap_violations, staff_availability_violations, location_violations,
+        location_activity_violations, activity_violations, group_wf_violations, leads_violations,
+        no_leads_or_assists_violations, inspection_violations, driving_range_violations,
+        daily_activity_repetition_violations, max_staff_violations, trip_assignment_violations,
+        trip_time_slot_violations, trip_staff_consistency_violations,
+    ])
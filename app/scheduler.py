@@ -1,43 +1,58 @@
 from ortools.sat.python import cp_model
 from data_manager import DataManager
 from schedule_tests import run_tests
-from datetime import datetime
-import calendar
+from collections import defaultdict
+from functools import lru_cache
+from itertools import product
 import pandas as pd
 import time
 import os
-from hyperparameters import OPTIMIZATION_WEIGHTS, SOLVER_TIME_LIMIT
+from hyperparameters import (OPTIMIZATION_WEIGHTS, SOLVER_TIME_LIMIT, NUM_SEARCH_WORKERS,
+                             WARM_START_FROM_LAST_SCHEDULE)
 
+# Days and periods of the camp week, in the order used for the output CSVs
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+PERIODS = [1, 2, 3]
+
+@lru_cache(maxsize=None)
 def map_dates_to_time_slots(dates):
     """
     Converts calendar dates to day-of-week time slots used in the schedule model.
     Each date is transformed into multiple time slots (one for each period in the day).
+    Results are cached, since many staff share the same days off.
     
-    :param dates: List of dates in MM/DD/YYYY format
-    :return: List of time slots in (day_name, period) format
+    :param dates: Tuple of dates in MM/DD/YYYY format (a tuple so it can be cached)
+    :return: Tuple of time slots in (day_name, period) format
     """
-    time_slots_map = []
-
-    for date_str in dates:
-        date_dt = datetime.strptime(date_str, "%m/%d/%Y")
-        # day_of_week_number is 0 for Monday, 6 for Sunday
-        day_of_week_number = date_dt.weekday()
-        day_name = calendar.day_name[day_of_week_number]
+    # Parse all dates at once and look up their day names
+    day_names = pd.to_datetime(pd.Series(dates, dtype=object), format="%m/%d/%Y").dt.day_name()
 
-        # Skip sundays since never on schedule
-        if day_name == "Sunday":
-            continue
+    # Skip sundays since never on schedule, then build the three time slots per day
+    return tuple((day_name, period) for day_name in day_names[day_names != "Sunday"] for period in range(1, 4))
 
-        # Otherwise, build the three time slots
-        for period in range(1,4):
-            time_slots_map.append((day_name, period))
-
-    return time_slots_map
+def group_values_by_key(df, key_column, value_column):
+    """
+    Collects the values of one DataFrame column into lists keyed by another column.
+    Equivalent to df.groupby(key_column)[value_column].apply(list).to_dict(), without
+    the per-group overhead of groupby-apply.
+
+    :param df: DataFrame to read
+    :param key_column: Name of the column holding the keys
+    :param value_column: Name of the column holding the values
+    :return: Dictionary mapping each key to the list of its values, in row order
+    """
+    grouped = {}
+    for key, value in zip(df[key_column], df[value_column]):
+        grouped.setdefault(key, []).append(value)
+    return grouped
 
 class Scheduler:
     def __init__(self, staff_df, activity_df, location_df, location_options_df, group_df, time_slots,
                  staff_off_time_slots, leads_mapping, assists_mapping, waterfront_schedule, allowed_dr_days, staff_trips,
-                 optimization_weights=None, leads_priority=None):
+                 optimization_weights=None, leads_priority=None, num_workers=None, debug_names=False,
+                 random_seed=None, log_search_progress=False,
+                 use_decision_strategy=False, solver_parameters=None, use_greedy_hint=False,
+                 warm_start=None):
         """
         Initialize the Scheduler with all necessary camp data.
         
@@ -57,6 +72,25 @@ class Scheduler:
             - staff_diversity: weight for staff activity diversity objective
             - group_diversity: weight for group activity category diversity objective
         :param leads_priority: Dictionary mapping (staffID, activityID) to priority (0-4)
+        :param num_workers: Number of parallel CP-SAT search workers (defaults to the
+            number of CPU cores, capped at 16)
+        :param debug_names: Give model variables descriptive names for debugging (slower to build)
+        :param random_seed: Seed for the solver's random choices, to make runs reproducible
+            (defaults to the CP-SAT default seed)
+        :param log_search_progress: Print CP-SAT's own detailed search log instead of the
+            short solution-progress messages
+        :param use_decision_strategy: Have the solver branch on the driving range days,
+            inspections and waterski staff days, then on the objective terms, first
+            (experimental; benchmark before enabling, it can also slow the search down)
+        :param solver_parameters: Dictionary of extra CP-SAT parameters to set by name, e.g.
+            {'linearization_level': 1, 'cp_model_probing_level': 1}, for tuning experiments.
+            Repeated parameters take a list, e.g. {'subsolvers': ['default_lp', 'no_lp']}
+        :param use_greedy_hint: Start the search from a greedy guess at each group's driving
+            range day and golf + tennis slots and each day's cabin inspector
+            (see _greedy_initial_assignment)
+        :param warm_start: A schedule returned by an earlier solve() (list of dictionaries), used
+            as a solution hint so the search starts from it. Entries that no longer fit the
+            camp data are ignored. Takes the place of use_greedy_hint when given.
         """
         self.staff_df = staff_df
         self.activity_df = activity_df
@@ -86,44 +120,133 @@ class Scheduler:
         else:
             self.optimization_weights = optimization_weights
 
-    def solve(self):
+        # Number of parallel search workers. CP-SAT runs a portfolio of strategies
+        # in parallel, with little gain beyond 16 workers.
+        if num_workers is None:
+            num_workers = min(16, os.cpu_count() or 1)
+        self.num_workers = num_workers
+        self.debug_names = debug_names
+        self.random_seed = random_seed
+        self.log_search_progress = log_search_progress
+        self.use_decision_strategy = use_decision_strategy
+        self.solver_parameters = solver_parameters if solver_parameters is not None else {}
+        self.use_greedy_hint = use_greedy_hint
+        self.warm_start = warm_start
+
+        # Time slots grouped by day
+        self._slots_by_day = {}
+        for k in self.time_slots:
+            self._slots_by_day.setdefault(k[0], []).append(k)
+
+        # Unique days in schedule order. Kept in a fixed order so the model is built
+        # identically on every run.
+        self._days = list(self._slots_by_day)
+
+        # Period 1 time slots (the only periods with cabin inspection)
+        self._period1_slots = tuple(k for k in self.time_slots if k[1] == 1)
+
+        # Name <-> ID lookups, used to find the special activities, to name the
+        # extracted schedule and to map a warm start schedule back to IDs
+        self._staff_name_by_id = dict(zip(self.staff_df["staffID"], self.staff_df["staffName"]))
+        self._staff_id_by_name = dict(zip(self.staff_df["staffName"], self.staff_df["staffID"]))
+        self._activity_name_by_id = dict(zip(self.activity_df["activityID"], self.activity_df["activityName"]))
+        self._activity_id_by_name = dict(zip(self.activity_df["activityName"], self.activity_df["activityID"]))
+        self._location_name_by_id = dict(zip(self.location_df["locID"], self.location_df["locName"]))
+
+        # Model built on the first call to solve() and reused by later calls
+        self._model = None
+        self._model_vars = None
+
+    def _build_model(self):
         """
-        Builds and solves the constraint satisfaction problem for camp scheduling.
-        Returns a complete schedule if a feasible solution is found.
-        
-        :return: List of dictionaries containing schedule entries
-        :raises: ValueError if no feasible solution is found
+        Builds the constraint programming model for camp scheduling: all decision variables,
+        constraints and optimization variables, but not the objective.
+        The model is stored in self._model and the variables needed to set the objective
+        and extract the schedule are stored in self._model_vars.
         """
         # Extract all entity IDs from DataFrames
         staff_ids = self.staff_df["staffID"].tolist()
         activity_ids = self.activity_df["activityID"].tolist()
         location_ids = self.location_df["locID"].tolist()
         group_ids = self.group_df["groupID"].tolist()
+
+        # Time slot structure (precomputed in __init__)
+        slots_by_day = self._slots_by_day
+        days = self._days
+        period_one_slots = self._period1_slots
+
+        # Each staff member's time off as a set, for fast membership checks
+        off_slots = {i: frozenset(self.staff_off_time_slots.get(i, [])) for i in staff_ids}
+
+        # Time slots each staff member spends on trips
+        trip_slots = {i: frozenset(k for k, _ in self.staff_trips.get(i, [])) for i in staff_ids}
+
+        # Waterfront time slots for each group, as frozensets for fast membership checks
+        # (and so they can also be used directly as dictionary keys)
+        waterfront_slots = {g: frozenset(slots) for g, slots in self.waterfront_schedule.items()}
         
+        # Activity ID by name, used to look up the activities with special constraints
+        activity_id_by_name = self._activity_id_by_name
+
         # Get IDs for special activities that have specific constraints
-        waterfront_id = self.activity_df.loc[
-            self.activity_df["activityName"] == "waterfront",
-            "activityID"
-        ].values[0]
-        golf_id = self.activity_df.loc[self.activity_df["activityName"] == "golf", "activityID"].values[0]
-        tennis_id = self.activity_df.loc[self.activity_df["activityName"] == "tennis", "activityID"].values[0]
-        # Waterskiing (runs in tandem with waterfront)
-        waterskiing_id = self.activity_df.loc[
-            self.activity_df["activityName"].str.lower() == "waterskiing".lower(),
-            "activityID"
-        ].values[0]
+        waterfront_id = activity_id_by_name["waterfront"]
+        golf_id = activity_id_by_name["golf"]
+        tennis_id = activity_id_by_name["tennis"]
+        # Waterskiing (runs in tandem with waterfront; its name is matched case-insensitively)
+        waterskiing_id = next(j for name, j in activity_id_by_name.items() if name.lower() == "waterskiing")
 
         # Create a dictionary to map activity IDs to their categories
-        activity_categories = {}
-        for _, row in self.activity_df.iterrows():
-            activity_categories[row['activityID']] = row['category']
+        activity_categories = dict(zip(self.activity_df['activityID'], self.activity_df['category']))
         
         # Get unique activity categories
         unique_categories = self.activity_df['category'].unique().tolist()
 
+        # Activities belonging to each category
+        activities_by_category = {
+            cat: [j for j in activity_ids if activity_categories.get(j) == cat] for cat in unique_categories
+        }
+
+        # Per-activity lookups: minimum staff required, maximum staff and duration
+        num_staff_req = dict(zip(self.activity_df["activityID"], self.activity_df["numStaffReq"]))
+        max_staff_by_activity = dict(zip(self.activity_df["activityID"], self.activity_df["maxStaff"]))
+        activity_duration = dict(zip(self.activity_df["activityID"], self.activity_df["duration"]))
+        driving_range_id = activity_id_by_name["driving range"]
+
+        # Activities each staff member can lead, and can lead or assist with
+        # (frozensets, so they can also be used directly as parts of dictionary keys)
+        leads_set = {i: frozenset(self.leads_mapping.get(i, [])) for i in staff_ids}
+        can_participate = {i: leads_set[i] | frozenset(self.assists_mapping.get(i, [])) for i in staff_ids}
+
+        # Valid locationIDs for each activityID, from the location options DataFrame
+        # (activities with no location options map to an empty tuple)
+        valid_locations = defaultdict(tuple, {
+            j: tuple(locs)
+            for j, locs in group_values_by_key(self.location_options_df, "activityID", "locID").items()
+        })
+
+        # Activities that can take place at each location
+        activities_by_location = defaultdict(list)
+        for j in activity_ids:
+            for l in valid_locations[j]:
+                activities_by_location[l].append(j)
+
+        # Staff who can lead each activity
+        staff_ids_that_lead = {j: [i for i in staff_ids if j in leads_set[i]] for j in activity_ids}
+
         # Initialize the constraint programming model
         model = cp_model.CpModel()
 
+        # Whether to give variables descriptive names (only useful when inspecting the model)
+        debug = self.debug_names
+
+        # Shared constant used wherever a single missing staff_assign entry is referenced
+        zero = model.NewConstant(0)
+
+        # Variables that must always be 0. These are collected while building the
+        # constraints and fixed with a single sum constraint at the end, rather than
+        # one model.Add(var == 0) call each.
+        fixed_to_zero = []
+
         # DECISION VARIABLES:
         # staff_assign[i, j, k, g]: Whether staff i is assigned to activity j, 
         # in time slot k, for group g
@@ -157,59 +280,91 @@ class Scheduler:
         # trip_assign[i,k, trip_name] = 1 if staff i is assigned to trip_name at time k
         trip_assign = {}
 
-        # Create decision variables for staff assignments to activities
+        # Create decision variables for staff assignments to activities.
+        # Variables are only named when debug_names is set: formatting ~100k names
+        # is a large share of model build time and the names are never read back.
+        # Variables are only created for activities the staff member can lead or
+        # assist with, outside their time off and trips (Constraints 7, 9 and 24).
+        # Any missing (i, j, k, g) key is an assignment that can never happen.
+        # The (activity, time slot) pairs open to each staff member are the same for
+        # every group, so they are worked out once here.
+        assignable_pairs = {
+            i: [(j, k) for j in activity_ids if j in can_participate[i]
+                for k in self.time_slots if k not in off_slots[i] and k not in trip_slots[i]]
+            for i in staff_ids
+        }
+        new_bool_var = model.NewBoolVar
+
+        # Only waterfront and waterskiing run in a group's waterfront slots (Constraint 11),
+        # so no staff_assign variables are created for other activities in those slots.
+        waterfront_activity_ids = (waterfront_id, waterskiing_id)
+
+        # staff_assign variables of each (j, k, g) cell, in staff order, for the staff count sums,
+        # and of each (i, k) staff member and time slot, for the staff non-overlap constraints
+        staff_assign_by_cell = defaultdict(list)
+        staff_assign_by_staff_slot = defaultdict(list)
         for g in group_ids:
+            group_waterfront_slots = waterfront_slots.get(g, ())
             for i in staff_ids:
-                for j in activity_ids:
-                    for k in self.time_slots:
-                        staff_assign[i,j,k, g] = model.NewBoolVar(f'x[{i},{j},{k[0]}, {k[1]},{g}]')
-
-            # Create decision variables for location assignments to activities
-            for l in location_ids:
-                for j in activity_ids:
-                    for k in self.time_slots:
-                        loc_assign[l,j,k, g] = model.NewBoolVar(f'y[{l},{j},{k[0]}, {k[1]},{g}]')
+                for j, k in assignable_pairs[i]:
+                    if k in group_waterfront_slots and j not in waterfront_activity_ids:
+                        continue
+                    var = new_bool_var(f'x[{i},{j},{k[0]}, {k[1]},{g}]' if debug else '')
+                    staff_assign[i,j,k, g] = var
+                    staff_assign_by_cell[j, k, g].append(var)
+                    staff_assign_by_staff_slot[i, k].append(var)
 
         # Create staff count variables and activity selection variables
         for g in group_ids:
             for j in activity_ids:
+                # Staff count is either 0 (activity not running) or between the activity's
+                # minimum staff requirement (Constraint 8) and its maxStaff (Constraint 26)
+                max_staff = min(max_staff_by_activity[j], len(staff_ids))
+                staff_count_intervals = [[0, 0]]
+                if num_staff_req[j] <= max_staff:
+                    staff_count_intervals.append([num_staff_req[j], max_staff])
+                staff_count_domain = cp_model.Domain.FromIntervals(staff_count_intervals)
                 for k in self.time_slots:
                     # Create an IntVar for total staff assigned to activity j, k, g
-                    staff_count[j,k,g] = model.NewIntVar(
-                        0,
-                        len(staff_ids),
-                        f't[{j},{k[0]}, {k[1]},{g}]'
+                    staff_count[j,k,g] = model.NewIntVarFromDomain(
+                        staff_count_domain, f't[{j},{k[0]}, {k[1]},{g}]' if debug else ''
                     )
 
                     # Constraint: Staff count equals sum of all staff assignments
-                    model.Add(
-                        staff_count[j,k,g] == sum(staff_assign[i,j,k,g] for i in staff_ids)
-                    )
+                    model.Add(staff_count[j,k,g] == cp_model.LinearExpr.Sum(staff_assign_by_cell[j, k, g]))
 
                     # Boolean variable indicating if activity j is chosen for time slot k and group g
-                    activity_chosen[j,k,g] = model.NewBoolVar(
-                        f'z[{j},{k[0]}, {k[1]},{g}]'
-                    )
+                    activity_chosen[j,k,g] = new_bool_var(f'z[{j},{k[0]}, {k[1]},{g}]' if debug else '')
+
+                    # Location assignments, only for the activity's valid locations. An activity
+                    # with a single valid location is there exactly when it is chosen, so that
+                    # location's assignment is the activity_chosen variable itself.
+                    if len(valid_locations[j]) == 1:
+                        loc_assign[valid_locations[j][0], j, k, g] = activity_chosen[j,k,g]
+                    else:
+                        for l in valid_locations[j]:
+                            loc_assign[l,j,k, g] = new_bool_var(f'y[{l},{j},{k[0]}, {k[1]},{g}]' if debug else '')
 
         # Create variables for golf and tennis scheduling (special case where they must be scheduled together)
-        for g in group_ids:
-            for k in self.time_slots:
-                golf_tennis_slot[k,g] = model.NewBoolVar(f"both_golf_tennis_{k}_{g}")
+        for g, k in product(group_ids, self.time_slots):
+            golf_tennis_slot[k,g] = new_bool_var(f"both_golf_tennis_{k}_{g}" if debug else '')
 
         # Create variables for cabin inspection assignments (only in period 1)
-        for i in staff_ids:
-            for k in time_slots:
-                if k[1] == 1: # period 1
-                    inspection_slot[i,k] = model.NewBoolVar(f"inspection_{i}_{k}")
-                else:
-                    pass # no inspection in period 2 or 3
+        for i, k in product(staff_ids, period_one_slots):
+            inspection_slot[i,k] = new_bool_var(f"inspection_{i}_{k}" if debug else '')
 
         # Create variables for driving range scheduling (special activity spanning two periods)
         for g in group_ids:
             for day in self.allowed_dr_days:
-                driving_range_day[g, day] = model.NewBoolVar(f"driving_range_g{g}_{day}")
+                driving_range_day[g, day] = model.NewBoolVar(f"driving_range_g{g}_{day}" if debug else '')
                 for i in staff_ids:
-                    driving_range_staff[g, day, i] = model.NewBoolVar(f"driving_range_g{g}_{day}_{i}")
+                    # Staff who cannot work driving range in both periods (time off or not
+                    # qualified) get the constant 0 instead of a variable (Constraint 22)
+                    if ((i, driving_range_id, (day, 1), g) not in staff_assign
+                            or (i, driving_range_id, (day, 2), g) not in staff_assign):
+                        driving_range_staff[g, day, i] = zero
+                        continue
+                    driving_range_staff[g, day, i] = new_bool_var(f"driving_range_g{g}_{day}_{i}" if debug else '')
 
         # Create variables for trip assignments (staff going on trips outside of camp)
         trip_name_list = set() # gather unique names from staff trips
@@ -218,56 +373,68 @@ class Scheduler:
                 continue
             for (k, trip_name) in self.staff_trips[i]:
                 trip_name_list.add(trip_name)
-
-        for i in staff_ids:
-            if i not in self.staff_trips:
-                continue
-            for (k, trip_name) in self.staff_trips[i]:
-                trip_assign[i,k, trip_name] = model.NewBoolVar(f"trip_{i}_{k[0]}_{k[1]}_{trip_name}")
+                trip_assign[i,k, trip_name] = model.NewBoolVar(f"trip_{i}_{k[0]}_{k[1]}_{trip_name}" if debug else '')
 
         #########################################
         # OPTIMIZATION VARIABLES - STARTS HERE
         #########################################
         
-        # 1. Staff Total Assignments
-        # Calculate total assignments for each staff member for use in other optimization variables
+        # 1. Staff Activity Counts and Total Assignments
+        # Linear expressions counting how many times each staff member is assigned to each
+        # activity, and in total, for use in other optimization variables (expressions rather
+        # than IntVars, so they add no extra variable or equality constraint to the model)
+        max_activity_count = len(self.time_slots) * len(group_ids)  # Maximum possible repetitions
+
+        # Group the staff_assign variables by (staff, activity) in a single pass
+        staff_activity_terms = defaultdict(list)
+        for (i, j, k, g), var in staff_assign.items():
+            staff_activity_terms[i, j].append(var)
+
+        staff_activity_count = {}
         staff_total_assignments = {}
         for i in staff_ids:
-            # Count all regular activity assignments
-            staff_total_assignments[i] = model.NewIntVar(
-                0, 
-                len(activity_ids) * len(self.time_slots) * len(group_ids), 
-                f'staff_total_assignments_{i}'
-            )
-            
-            # Sum all assignments for this staff member across all activities, time slots, and groups
-            model.Add(
-                staff_total_assignments[i] == sum(
-                    staff_assign[i,j,k,g] 
-                    for j in activity_ids 
-                    for k in self.time_slots 
-                    for g in group_ids
-                )
-            )
-        
-        # 2. Staff Activity Diversity Variables
-        # For each staff member and activity, count how many times they're assigned to that activity
-        staff_activity_count = {}
-        max_activity_count = len(self.time_slots) * len(group_ids)  # Maximum possible repetitions
+            for j in activity_ids:
+                # All assignments of staff i to activity j across all time slots and groups
+                staff_activity_count[i,j] = cp_model.LinearExpr.Sum(staff_activity_terms.get((i, j), []))
+
+            # Total assignments, built from the per-activity counts
+            staff_total_assignments[i] = cp_model.LinearExpr.Sum([staff_activity_count[i,j] for j in activity_ids])
         
+        # Symmetry breaking: staff with identical qualifications, lead priorities,
+        # time off and trips are interchangeable (swapping their schedules gives an
+        # equally good solution). Order each such group of staff by total assignments
+        # so the solver does not explore every permutation of the same schedule.
+        interchangeable_staff = {}
         for i in staff_ids:
-            for j in activity_ids:
-                staff_activity_count[i,j] = model.NewIntVar(0, max_activity_count, f'staff_activity_count_{i}_{j}')
-                
-                # Sum all assignments of staff i to activity j across all time slots and groups
+            staff_key = (
+                leads_set[i],
+                can_participate[i],
+                frozenset((j, self.leads_priority.get((i, j), 0)) for j in leads_set[i]),
+                off_slots[i],
+                frozenset(self.staff_trips.get(i, [])),
+            )
+            interchangeable_staff.setdefault(staff_key, []).append(i)
+
+        for staff_class in interchangeable_staff.values():
+            for i1, i2 in zip(staff_class, staff_class[1:]):
+                model.Add(staff_total_assignments[i1] >= staff_total_assignments[i2])
+
+        # Groups with the same waterfront slots are interchangeable in the same way (every
+        # other constraint treats groups alike). Order each such group of groups by the
+        # day they go to the driving range.
+        interchangeable_groups = {}
+        for g in group_ids:
+            interchangeable_groups.setdefault(waterfront_slots[g], []).append(g)
+
+        day_order = list(range(len(self.allowed_dr_days)))
+        for group_class in interchangeable_groups.values():
+            for g1, g2 in zip(group_class, group_class[1:]):
                 model.Add(
-                    staff_activity_count[i,j] == sum(
-                        staff_assign[i,j,k,g] 
-                        for k in self.time_slots 
-                        for g in group_ids
-                    )
+                    cp_model.LinearExpr.WeightedSum([driving_range_day[g1, day] for day in self.allowed_dr_days], day_order)
+                    <= cp_model.LinearExpr.WeightedSum([driving_range_day[g2, day] for day in self.allowed_dr_days], day_order)
                 )
         
+        # 2. Staff Activity Diversity Variables
         # Penalize activity repetitions: count cases where staff does same activity MORE THAN 4 TIMES
         # (changed from the original implementation that penalized beyond 1 repetition)
         staff_repeated_activities = model.NewIntVar(0, len(staff_ids) * len(activity_ids) * max_activity_count, 'staff_repeated_activities')
@@ -276,69 +443,51 @@ class Scheduler:
         repeated_activity_terms = []
         for i in staff_ids:
             for j in activity_ids:
+                # Staff with at most 4 possible assignments to this activity (including those
+                # not qualified for it) can never exceed the limit, so need no excess variable
+                num_possible = len(staff_activity_terms.get((i, j), []))
+                if num_possible <= 4:
+                    continue
+
                 # Create a variable that's max(0, staff_activity_count[i,j] - 4)
-                excess_count = model.NewIntVar(0, max_activity_count - 4, f'excess_count_{i}_{j}')
-                
-                # If staff_activity_count[i,j] > 4, we want to count the excess (repetitions)
-                # staff_activity_count[i,j] - 4 if positive, otherwise 0
-                excess_indicator = model.NewBoolVar(f'excess_indicator_{i}_{j}')
-                model.Add(staff_activity_count[i,j] >= 5).OnlyEnforceIf(excess_indicator)
-                model.Add(staff_activity_count[i,j] <= 4).OnlyEnforceIf(excess_indicator.Not())
-                
-                model.Add(excess_count == staff_activity_count[i,j] - 4).OnlyEnforceIf(excess_indicator)
-                model.Add(excess_count == 0).OnlyEnforceIf(excess_indicator.Not())
+                # i.e. the number of repetitions beyond the fourth
+                excess_count = model.NewIntVar(0, num_possible - 4, f'excess_count_{i}_{j}' if debug else '')
+                model.AddMaxEquality(excess_count, [staff_activity_count[i,j] - 4, 0])
                 
                 repeated_activity_terms.append(excess_count)
         
-        model.Add(staff_repeated_activities == sum(repeated_activity_terms))
+        model.Add(staff_repeated_activities == cp_model.LinearExpr.Sum(repeated_activity_terms))
         
         # 3. Group Activity Diversity Variables
         # Track category diversity for each group in each time slot
         
         # For each group, day, period, and category, track if that category is represented
         group_has_category = {}
-        days = list(set(k[0] for k in self.time_slots))
-        periods = list(set(k[1] for k in self.time_slots))
         
         # Filter out "fixed" category (waterfront) from optimization
         optimizable_categories = [cat for cat in unique_categories if cat != "fixed"]
         
         for g in group_ids:
-            for day in days:
-                for period in periods:
-                    for category in optimizable_categories:
-                        time_slot = (day, period)
-                        if time_slot in self.time_slots:  # Check if this time slot exists
-                            group_has_category[g, day, period, category] = model.NewBoolVar(
-                                f'group_has_category_{g}_{day}_{period}_{category}'
-                            )
-                            
-                            # Calculate if group g has any activity in this category during this time slot
-                            category_activities = [j for j in activity_ids if activity_categories.get(j) == category]
-                            
-                            # If any activity in this category is chosen, set group_has_category to 1
-                            model.Add(
-                                sum(activity_chosen[j, time_slot, g] for j in category_activities) >= 1
-                            ).OnlyEnforceIf(group_has_category[g, day, period, category])
-                            
-                            model.Add(
-                                sum(activity_chosen[j, time_slot, g] for j in category_activities) == 0
-                            ).OnlyEnforceIf(group_has_category[g, day, period, category].Not())
+            for time_slot in self.time_slots:
+                day, period = time_slot
+                for category in optimizable_categories:
+                    group_has_category[g, day, period, category] = model.NewBoolVar(
+                        f'group_has_category_{g}_{day}_{period}_{category}' if debug else ''
+                    )
+
+                    # group_has_category is 1 exactly when any activity in this category is chosen
+                    # for group g in this time slot (the maximum of Booleans is their OR)
+                    model.AddMaxEquality(
+                        group_has_category[g, day, period, category],
+                        [activity_chosen[j, time_slot, g] for j in activities_by_category[category]]
+                    )
         
-        # Count total category variety across all groups, days, and periods
+        # Count total category variety across all groups and time slots
         # Only considering optimizable categories (excluding fixed/waterfront)
-        group_category_variety = model.NewIntVar(0, len(group_ids) * len(days) * len(periods) * len(optimizable_categories), 
-                                               'group_category_variety')
+        group_category_variety = model.NewIntVar(0, len(group_has_category), 'group_category_variety')
         
         model.Add(
-            group_category_variety == sum(
-                group_has_category[g, day, period, category]
-                for g in group_ids
-                for day in days
-                for period in periods
-                for category in optimizable_categories
-                if (day, period) in self.time_slots  # Only count valid time slots
-            )
+            group_category_variety == cp_model.LinearExpr.Sum(list(group_has_category.values()))
         )
         
         # 4. Group Weekly Unique Activity Diversity Variables
@@ -347,19 +496,15 @@ class Scheduler:
         for g in group_ids:
             for j in activity_ids:
                 group_has_activity_weekly[g, j] = model.NewBoolVar(
-                    f'group_has_activity_weekly_{g}_{j}'
+                    f'group_has_activity_weekly_{g}_{j}' if debug else ''
                 )
                 
-                # Sum of occurrences of activity j for group g throughout the week
-                sum_activity_occurrences_for_group_week = sum(
-                    activity_chosen[j, k, g] for k in self.time_slots
+                # group_has_activity_weekly is 1 exactly when activity j is chosen for group g
+                # in any time slot of the week (the maximum of Booleans is their OR)
+                model.AddMaxEquality(
+                    group_has_activity_weekly[g, j],
+                    [activity_chosen[j, k, g] for k in self.time_slots]
                 )
-                
-                # Link group_has_activity_weekly to sum_activity_occurrences_for_group_week
-                # If sum >= 1, group_has_activity_weekly must be true
-                model.Add(sum_activity_occurrences_for_group_week >= 1).OnlyEnforceIf(group_has_activity_weekly[g, j])
-                # If sum == 0, group_has_activity_weekly must be false
-                model.Add(sum_activity_occurrences_for_group_week == 0).OnlyEnforceIf(group_has_activity_weekly[g, j].Not())
 
         # Total count of unique group-activity pairs for the week
         total_group_weekly_activity_diversity = model.NewIntVar(
@@ -368,49 +513,48 @@ class Scheduler:
             'total_group_weekly_activity_diversity'
         )
         model.Add(
-            total_group_weekly_activity_diversity == sum(
+            total_group_weekly_activity_diversity == cp_model.LinearExpr.Sum([
                 group_has_activity_weekly[g, j]
                 for g in group_ids
                 for j in activity_ids
-            )
+            ])
         )
 
         # 5. Staff Unassigned Periods Balance
         # Objective to have each staff member have approximately 2 unassigned periods per week
         target_unassigned_periods = 2
         
-        # Get all period 1 time slots for inspection calculation
-        period_one_slots = [k for k in self.time_slots if k[1] == 1]
-
         unassigned_dev_terms = []
         for i in staff_ids:
             # Calculate available slots (not off, not on a trip)
-            staff_off_slots = self.staff_off_time_slots.get(i, [])
-            staff_trip_slots = [trip[0] for trip in self.staff_trips.get(i, [])]
+            staff_off_slots = off_slots[i]
+            staff_trip_slots = trip_slots[i]
             available_slots = [k for k in self.time_slots if k not in staff_off_slots and k not in staff_trip_slots]
             num_available_slots = len(available_slots)
 
-            # Total periods worked by staff (activities + inspections)
-            total_work_periods = model.NewIntVar(0, len(self.time_slots), f'total_work_periods_{i}')
+            # Total periods worked by staff (activities + inspections).
+            # Staff work at most one thing per slot and never while off or on a trip,
+            # so this can never exceed the number of available slots.
+            total_work_periods = model.NewIntVar(0, num_available_slots, f'total_work_periods_{i}' if debug else '')
             
             # Sum of activity assignments (already calculated in staff_total_assignments)
             # Sum of inspection assignments
-            inspection_assignments = sum(inspection_slot[i, k] for k in period_one_slots)
+            inspection_assignments = cp_model.LinearExpr.Sum([inspection_slot[i, k] for k in period_one_slots])
             
             model.Add(total_work_periods == staff_total_assignments[i] + inspection_assignments)
             
-            # Unassigned periods for this staff member
-            unassigned_periods = model.NewIntVar(-len(self.time_slots), len(self.time_slots), f'unassigned_periods_{i}')
-            model.Add(unassigned_periods == num_available_slots - total_work_periods)
-            
-            # Deviation from the target of 2 unassigned periods
-            deviation = model.NewIntVar(0, len(self.time_slots), f'unassigned_dev_abs_{i}')
-            model.AddAbsEquality(deviation, unassigned_periods - target_unassigned_periods)
+            # Deviation of the unassigned periods (available - worked) from the target of 2.
+            # Unassigned periods lie in [0, num_available_slots], which bounds the deviation.
+            max_deviation = max(target_unassigned_periods, num_available_slots - target_unassigned_periods)
+            deviation = model.NewIntVar(0, max_deviation, f'unassigned_dev_abs_{i}' if debug else '')
+            model.AddAbsEquality(
+                deviation, num_available_slots - total_work_periods - target_unassigned_periods
+            )
             unassigned_dev_terms.append(deviation)
 
         # Sum of deviations for all staff
         total_unassigned_periods_deviation = model.NewIntVar(0, len(staff_ids) * len(self.time_slots), 'total_unassigned_periods_deviation')
-        model.Add(total_unassigned_periods_deviation == sum(unassigned_dev_terms))
+        model.Add(total_unassigned_periods_deviation == cp_model.LinearExpr.Sum(unassigned_dev_terms))
 
         # 6. High-Priority Lead Assignments Score
         # Calculate a score representing how often high-priority lead staff are assigned
@@ -422,8 +566,9 @@ class Scheduler:
 
         total_priority_score = model.NewIntVar(0, max_possible_priority_score, 'total_priority_score')
 
-        # Build linear expression of priority * assignment boolean variables
-        priority_expr_terms = []
+        # Build weighted sum of priority * assignment boolean variables
+        priority_vars = []
+        priority_coeffs = []
         for i in staff_ids:
             for j in activity_ids:
                 priority_val = self.leads_priority.get((i, j), 0)
@@ -431,10 +576,13 @@ class Scheduler:
                     continue  # No contribution if no priority specified
                 for k in self.time_slots:
                     for g in group_ids:
-                        priority_expr_terms.append(priority_val * staff_assign[i, j, k, g])
+                        if (i, j, k, g) not in staff_assign:
+                            continue
+                        priority_vars.append(staff_assign[i, j, k, g])
+                        priority_coeffs.append(priority_val)
 
-        if priority_expr_terms:
-            model.Add(total_priority_score == sum(priority_expr_terms))
+        if priority_vars:
+            model.Add(total_priority_score == cp_model.LinearExpr.WeightedSum(priority_vars, priority_coeffs))
         else:
             # No priorities specified – force score to zero
             model.Add(total_priority_score == 0)
@@ -451,49 +599,51 @@ class Scheduler:
         # Each activity can be assigned to at most one group in a given time slot
         for j in activity_ids:
             for k in self.time_slots:
-                model.Add(
-                    sum(activity_chosen[j,k,g] for g in group_ids) <= 1
-                )
+                model.AddAtMostOne([activity_chosen[j,k,g] for g in group_ids])
 
         # Constraint 2: Staff non-overlap across activities and groups
         # Each staff member can be assigned to at most one activity across all groups in a time slot
+        # (period 1 slots are covered by Constraint 16, which also includes the inspection)
         for i in staff_ids:
             for k in self.time_slots:
-                model.Add(
-                    sum(staff_assign[i,j,k,g] for j in activity_ids for g in group_ids) <= 1
-                )
+                if k in period_one_slots:
+                    continue
+                model.AddAtMostOne(staff_assign_by_staff_slot[i, k])
 
         # Constraint 3: Location non-overlap across activities and groups
         # Each location can be used for at most one activity across all groups in a time slot
         for l in location_ids:
             for k in self.time_slots:
-                model.Add(
-                    sum(loc_assign[l,j,k,g] for j in activity_ids for g in group_ids) <= 1
+                model.AddAtMostOne(
+                    [loc_assign[l,j,k,g] for j in activities_by_location[l] for g in group_ids]
                 )
 
         # Constraint 4: Activities only take place in valid locations
-        # Create mapping of activityID to valid locationIDs from the location options DataFrame
-        valid_locations = (
-            self.location_options_df.groupby("activityID")["locID"]
-            .apply(list)
-            .to_dict()
-        )
-        
+        # (loc_assign variables only exist for valid locations)
         # Ensure activities are only assigned to valid locations
         for g in group_ids:
             for j in activity_ids:
+                # An activity with no valid locations can never be chosen
+                if not valid_locations[j]:
+                    fixed_to_zero.extend(activity_chosen[j,k,g] for k in self.time_slots)
+                    continue
+
+                # A single valid location is the activity_chosen variable itself (no link needed)
+                if len(valid_locations[j]) == 1:
+                    continue
+
                 for k in self.time_slots:
-                    valid_loc_vars = [loc_assign[l,j,k,g] for l in valid_locations.get(j, [])]
+                    valid_loc_vars = [loc_assign[l,j,k,g] for l in valid_locations[j]]
                     # If activity is chosen, exactly one valid location must be assigned
                     # If activity is not chosen, no location should be assigned
-                    model.Add(sum(valid_loc_vars) == activity_chosen[j,k,g])
+                    model.Add(cp_model.LinearExpr.Sum(valid_loc_vars) == activity_chosen[j,k,g])
 
         # Constraint 5: Group-specific activity assignment
         # Each group needs the right number of activities per time slot
         for g in group_ids:
             for k in self.time_slots:
                 # Skip waterfront slots which have special handling
-                if k in self.waterfront_schedule[g]:
+                if k in waterfront_slots[g]:
                     continue # waterfront already handled
 
                 # For regular time slots:
@@ -502,94 +652,60 @@ class Scheduler:
                 
                 # Regular case: 4 activities when not golf+tennis slot
                 model.Add(
-                    sum(activity_chosen[j,k,g] for j in activity_ids) == 4
+                    cp_model.LinearExpr.Sum([activity_chosen[j,k,g] for j in activity_ids]) == 4
                 ).OnlyEnforceIf(golf_tennis_slot[k, g].Not())
 
                 # Special case: 2 activities when golf+tennis slot
                 model.Add(
-                    sum(activity_chosen[j,k,g] for j in activity_ids) == 2
+                    cp_model.LinearExpr.Sum([activity_chosen[j,k,g] for j in activity_ids]) == 2
                 ).OnlyEnforceIf(golf_tennis_slot[k, g])
 
         # Constraint 6: Link staff, location, and activity assignments
-        # Ensure proper relationships between activity selection, location assignment, and staffing
-        for g in group_ids:
-            for j in activity_ids:
-                for k in self.time_slots:
-                    # If activity j is chosen for (k,g), exactly one location must be assigned
-                    model.Add(
-                        sum(loc_assign[l,j,k,g] for l in location_ids) == 1
-                    ).OnlyEnforceIf(activity_chosen[j,k,g])
-
-                    # If activity j is not chosen for (k,g), no location should be assigned
-                    model.Add(
-                        sum(loc_assign[l,j,k,g] for l in location_ids) == 0
-                    ).OnlyEnforceIf(activity_chosen[j,k,g].Not())
-
-                    # Additional constraints for location assignment:
-                    # - If a location is assigned to activity j, there must be staff assigned (count > 0)
-                    # - If activity j is not chosen, no location can be assigned to it
-                    for l in location_ids:
-                        model.Add(staff_count[j,k,g] > 0).OnlyEnforceIf(loc_assign[l,j,k,g])
-                        model.Add(loc_assign[l,j,k,g] == 0).OnlyEnforceIf(activity_chosen[j,k,g].Not())
+        # The location side is the channeling equality in Constraint 4 (one valid location
+        # exactly when the activity is chosen), so no reified copy of it is needed here.
+        # A location is only assigned when the activity is chosen, and a chosen
+        # activity always has staff assigned (Constraint 8), so no per-location
+        # staffing or zeroing constraints are needed either.
 
         # Constraint 7: Staff availability
         # Staff cannot be assigned to activities during their time off
-        for i in staff_ids:
-            unavailable_time_slots = self.staff_off_time_slots.get(i, [])
-            for k in unavailable_time_slots:
-                # Staff cannot be assigned to any activity during their time off
-                for j in activity_ids:
-                    for g in group_ids:
-                        model.Add(staff_assign[i, j, k, g] == 0)
+        # (enforced by not creating staff_assign variables for those slots)
 
         # Staff cannot be assigned to inspection during their time off
+        # (inspection variables only exist for period 1 slots)
         for i in staff_ids:
-            unavailable_time_slots = self.staff_off_time_slots.get(i, [])
-            for k in unavailable_time_slots:
-                if k in inspection_slots:
-                    model.Add(inspection_slot[i,k] == 0)
+            for k in self.staff_off_time_slots.get(i, []):
+                if (i, k) in inspection_slot:
+                    fixed_to_zero.append(inspection_slot[i,k])
 
 
         # Constraint 8: Minimum staffing requirements for activities
-        # Each activity must have its required minimum number of staff when chosen
+        # Each activity must have its required minimum number of staff when chosen.
+        # The minimum is built into the staff_count domain ({0} or >= numStaffReq), so
+        # activity_chosen only needs to be channeled to "any staff assigned".
         for g in group_ids:
             for j in activity_ids:
                 for k in self.time_slots:
-                    # Get the minimum staff requirement for this activity from the activity DataFrame
-                    required_staff = self.activity_df.loc[
-                        self.activity_df["activityID"] == j,
-                        "numStaffReq"
-                    ].values[0]
-
-                    # If activity is chosen, ensure minimum staff requirement is met
-                    model.Add(staff_count[j, k, g] >= required_staff).OnlyEnforceIf(activity_chosen[j, k, g])
+                    # If activity is chosen, at least one (and so at least numStaffReq) staff are assigned
+                    model.Add(staff_count[j, k, g] >= 1).OnlyEnforceIf(activity_chosen[j, k, g])
                     
                     # If activity is not chosen, ensure no staff are assigned
                     model.Add(staff_count[j, k, g] == 0).OnlyEnforceIf(activity_chosen[j, k, g].Not())
 
         # Constraint 9: Skill qualification for activities
         # Staff can only be assigned to activities they can lead or assist with
-        for g in group_ids:
-            for i in staff_ids:
-                # Combine the sets of activities staff can lead or assist with
-                can_participate_set = set(leads_mapping.get(i,[])) | set(assists_mapping.get(i,[]))
-                for j in activity_ids:
-                    for k in self.time_slots:
-                        # If staff cannot lead or assist this activity, they cannot be assigned
-                        if j not in can_participate_set:
-                            model.Add(staff_assign[i, j, k, g] == 0)
+        # (enforced by not creating staff_assign variables for other activities)
 
         # Constraint 10: Leadership requirement for activities
         # Each activity must have at least one staff who can lead it
         for g in group_ids:
             for j in activity_ids:
                 for k in self.time_slots:
-                    # Sum up all staff who can lead this activity
-                    leads_assigned = sum(
-                        staff_assign[i, j, k, g] for i in staff_ids if j in leads_mapping.get(i, [])
-                    )
-                    # If activity is chosen, ensure at least one staff can lead it
-                    model.Add(leads_assigned >= 1).OnlyEnforceIf(activity_chosen[j, k, g])
+                    # If activity is chosen, at least one of the staff who can lead it is assigned
+                    # (a single clause; with no possible leads the activity can't be chosen)
+                    model.AddBoolOr([
+                        staff_assign[i, j, k, g] for i in staff_ids_that_lead[j] if (i, j, k, g) in staff_assign
+                    ]).OnlyEnforceIf(activity_chosen[j, k, g])
 
         # Constraint 11: Waterfront scheduling
         # Waterfront must be scheduled at fixed times for each group and as the only activity
@@ -600,88 +716,66 @@ class Scheduler:
                 # Waterskiing must ALSO be scheduled in every waterfront slot
                 model.Add(activity_chosen[waterskiing_id, k, g] == 1)
 
-                # 2) Exactly TWO activities (waterfront + waterskiing) should be present in the slot – no more, no less
-                model.Add(sum(activity_chosen[j,k,g] for j in activity_ids) == 2)
+                # 2) No other activity (nor the golf + tennis pairing) can be present in the slot.
+                # These activities have no staff_assign variables here, so they are fixed to 0.
+                fixed_to_zero.extend(
+                    activity_chosen[j,k,g] for j in activity_ids if j not in waterfront_activity_ids
+                )
+                fixed_to_zero.append(golf_tennis_slot[k, g])
 
         # Constraint 12: Golf and Tennis pairing requirement
         # Golf and Tennis must be scheduled together in the same time slot
         # When they are scheduled together, they are the only two activities in that slot
 
+        # (Exactly 2 activities in a golf + tennis slot is already Constraint 5, and
+        # golf_tennis_slot is fixed to 0 in waterfront slots by Constraint 11.)
         for g in group_ids:
-            for k in time_slots:
-                # When golf_tennis_slot is true, exactly 2 activities are chosen (golf and tennis)
-                model.Add(
-                    sum(activity_chosen[j, k, g] for j in activity_ids) == 2
+            for k in self.time_slots:
+                # Ensure that when golf_tennis_slot is true, those two activities must be golf and tennis
+                model.AddBoolAnd(
+                    [activity_chosen[golf_id, k, g], activity_chosen[tennis_id, k, g]]
                 ).OnlyEnforceIf(golf_tennis_slot[k, g])
 
-                # Ensure that when golf_tennis_slot is true, those two activities must be golf and tennis
-                model.Add(activity_chosen[golf_id, k, g] + activity_chosen[tennis_id, k, g] == 2).OnlyEnforceIf(golf_tennis_slot[k, g])
-                
                 # When golf_tennis_slot is false, golf and tennis cannot both be scheduled
                 # (at most one can be scheduled, or neither)
-                model.Add(activity_chosen[golf_id, k, g] + activity_chosen[tennis_id, k, g] <= 1).OnlyEnforceIf(golf_tennis_slot[k, g].Not())
+                model.AddBoolOr(
+                    [activity_chosen[golf_id, k, g].Not(), activity_chosen[tennis_id, k, g].Not()]
+                ).OnlyEnforceIf(golf_tennis_slot[k, g].Not())
 
         # Constraint 13: Golf and Tennis frequency requirement
         # Each group must have the golf and tennis pairing at least twice per week
         for g in group_ids:
             model.Add(
-                sum(golf_tennis_slot[k, g] for k in time_slots) >= 2
+                cp_model.LinearExpr.Sum([golf_tennis_slot[k, g] for k in self.time_slots]) >= 2
             )
 
         # Constraint 14: Daily golf and tennis limit
         # Golf and Tennis pairing can appear at most once per day for each group
-        day_map = {}  # Map time slots to their day of the week
-        for k in time_slots:
-            day_map[k] = k[0]  # k[0] contains the day name
-            
-        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
         for g in group_ids:
-            for d in days:
-                # Get all time slots for the current day
-                day_slots = [k for k in time_slots if day_map[k] == d]
-
+            for day_slots in slots_by_day.values():
                 # Limit golf + tennis pairing to at most once per day per group
-                model.Add(
-                    sum(golf_tennis_slot[k, g] for k in day_slots) <= 1
-                )
+                model.AddAtMostOne([golf_tennis_slot[k, g] for k in day_slots])
 
         # Constraint 15: Daily cabin inspection requirement
         # Exactly one staff member must be assigned to cabin inspection each day during period 1
-        days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-        for day in days:
-            # Create the period 1 time slot for this day
-            day_slot = (day, 1)
-            
+        for day_slot in period_one_slots:
             # Ensure exactly one staff is assigned to inspection
-            model.Add(
-                sum(inspection_slot[i,day_slot] for i in staff_ids) == 1
-            )
+            model.AddExactlyOne([inspection_slot[i,day_slot] for i in staff_ids])
 
         # Constraint 16: Inspection and activity exclusivity
         # Staff cannot be assigned to both inspection and regular activities in the same time slot
+        # (only period 1 has inspections, so only those slots need the constraint). This is also
+        # Constraint 2 for period 1: at most one of all the staff member's assignments in the slot.
         for i in staff_ids:
-            for k in time_slots:
-                if k[1] == 1:  # Only period 1 has inspections
-                    model.Add(
-                        sum(staff_assign[i,j,k,g] for j in activity_ids for g in group_ids) + inspection_slot[i,k] <= 1
-                    )
-                else:
-                    pass  # No inspection in periods 2 or 3, so no constraint needed
+            for k in period_one_slots:
+                model.AddAtMostOne(staff_assign_by_staff_slot[i, k] + [inspection_slot[i,k]])
 
         # Constraint 17: Driving range frequency requirement
         # Each group must have driving range exactly once per week on an allowed day
         for g in group_ids:
-            model.Add(
-                sum(driving_range_day[g, day] for day in self.allowed_dr_days) == 1
-            )
+            model.AddExactlyOne([driving_range_day[g, day] for day in self.allowed_dr_days])
 
         # Constraint 18: Driving range scheduling restrictions
-        # Get the driving range activity ID
-        driving_range_id = self.activity_df.loc[
-            self.activity_df["activityName"] == "driving range",
-            "activityID"
-        ].values[0]
-
         # Driving Range can only be scheduled during periods 1 and 2 on allowed days
         for g in group_ids:
             for j in activity_ids:
@@ -690,7 +784,7 @@ class Scheduler:
                         day, period = k
                         # If not an allowed day or period, driving range cannot be scheduled
                         if day not in self.allowed_dr_days or period not in [1, 2]:
-                            model.Add(activity_chosen[j, k, g] == 0)
+                            fixed_to_zero.append(activity_chosen[j, k, g])
 
         # Constraint 19: Driving range period continuity
         # Driving range must be scheduled for both periods 1 and 2 on the same day
@@ -700,50 +794,32 @@ class Scheduler:
                 k2 = (day, 2)  # Period 2 slot
                 dr_day_var = driving_range_day[g, day]  # Boolean variable for driving range on this day
 
-                # If driving range is scheduled on this day, it must be in both periods 1 and 2
-                model.Add(activity_chosen[driving_range_id, k1, g] == 1).OnlyEnforceIf(dr_day_var)
-                model.Add(activity_chosen[driving_range_id, k2, g] == 1).OnlyEnforceIf(dr_day_var)
-
-                # If driving range is not scheduled on this day, it must not be in either period
-                model.Add(activity_chosen[driving_range_id, k1, g] == 0).OnlyEnforceIf(dr_day_var.Not())
-                model.Add(activity_chosen[driving_range_id, k2, g] == 0).OnlyEnforceIf(dr_day_var.Not())
+                # Driving range is chosen in periods 1 and 2 exactly when it is scheduled on this day
+                model.Add(activity_chosen[driving_range_id, k1, g] == dr_day_var)
+                model.Add(activity_chosen[driving_range_id, k2, g] == dr_day_var)
 
                 # Constraint 20: Driving range staffing requirements
-                # At least one staff must be assigned to driving range when it's scheduled
-                model.Add(
-                    sum(driving_range_staff[g, day, i] for i in staff_ids) >= 1
-                ).OnlyEnforceIf(dr_day_var)
-
-                # If driving range is not scheduled, no staff should be assigned to it
-                model.Add(
-                    sum(driving_range_staff[g, day, i] for i in staff_ids) == 0
-                ).OnlyEnforceIf(dr_day_var.Not())
+                # At least one staff must be assigned to driving range when it's scheduled,
+                # and no staff when it isn't. Both are plain linear bounds on the staff count
+                # (1 * dr_day_var <= count <= len(staff_ids) * dr_day_var), so no reification.
+                dr_staff_count = cp_model.LinearExpr.Sum([driving_range_staff[g, day, i] for i in staff_ids])
+                model.Add(dr_staff_count >= dr_day_var)
+                model.Add(dr_staff_count <= len(staff_ids) * dr_day_var)
 
                 # Constraint 21: Driving range staff continuity
                 # Staff assigned to driving range must work both periods 1 and 2
                 for i in staff_ids:
-                    # Link the driving range staff variables to the actual staff assignments
-                    model.Add(
-                        staff_assign[i, driving_range_id, k1, g] == driving_range_staff[g, day, i]
-                    ).OnlyEnforceIf(dr_day_var)
-                    model.Add(
-                        staff_assign[i, driving_range_id, k2, g] == driving_range_staff[g, day, i]
-                    ).OnlyEnforceIf(dr_day_var)
-
-                    # If driving range is not scheduled, ensure no staff assignments
-                    model.Add(
-                        staff_assign[i, driving_range_id, k1, g] == 0
-                    ).OnlyEnforceIf(dr_day_var.Not())
-                    model.Add(
-                        staff_assign[i, driving_range_id, k2, g] == 0
-                    ).OnlyEnforceIf(dr_day_var.Not())
+                    # Link the driving range staff variables to the actual staff assignments.
+                    # When driving range is not scheduled, driving_range_staff is 0 (Constraint 20),
+                    # so these equalities also keep both periods free of driving range staff.
+                    # Missing staff_assign entries are already 0 and need no link.
+                    for k in (k1, k2):
+                        if (i, driving_range_id, k, g) in staff_assign:
+                            model.Add(staff_assign[i, driving_range_id, k, g] == driving_range_staff[g, day, i])
 
                     # Constraint 22: Staff availability for driving range
                     # Staff can only be assigned to driving range if available for both periods
-                    unavailable_time_slots = self.staff_off_time_slots.get(i, [])
-                    if k1 in unavailable_time_slots or k2 in unavailable_time_slots:
-                        # If staff is unavailable in either period, they cannot be assigned to driving range
-                        model.Add(driving_range_staff[g, day, i] == 0)
+                    # (enforced by making driving_range_staff the constant 0 for those staff)
 
         # Constraint 23: Trip assignment enforcement
         # Staff members must be assigned to trips listed in the trips data
@@ -758,81 +834,45 @@ class Scheduler:
                 )
 
         # Constraint 24: Trip exclusivity
-        # Staff on trips cannot be assigned to other activities or inspection
+        # Staff on trips cannot be assigned to other activities or inspection.
+        # Trips are always assigned (Constraint 23). No staff_assign variables exist for
+        # trip slots, so only the inspection assignments need to be fixed to 0.
         for i in staff_ids:
-            if i not in self.staff_trips:
-                continue
-
-            for (k, trip_name) in self.staff_trips[i]:
-                # Staff on trips cannot be assigned to any regular activities
-                model.Add(
-                    sum(staff_assign[i,j,k,g] for j in activity_ids for g in group_ids) == 0
-                ).OnlyEnforceIf(trip_assign[i,k, trip_name])
-
+            for (k, trip_name) in self.staff_trips.get(i, []):
                 # Staff on trips cannot be assigned to inspection duty
-                if k in inspection_slots:
-                    model.Add(
-                        inspection_slot[i,k] == 0
-                    ).OnlyEnforceIf(trip_assign[i,k, trip_name])
+                if (i, k) in inspection_slot:
+                    fixed_to_zero.append(inspection_slot[i,k])
 
         # Constraint 25: No group can have the same activity twice in the same day
-        days = list(set(k[0] for k in self.time_slots)) # Extract unique days
-        periods = list(set(k[1] for k in self.time_slots)) # Extract unique periods
-
+        # Activities with a duration greater than 1 span several periods and are exempt
+        short_activity_ids = [j for j in activity_ids if activity_duration[j] <= 1]
         for g in group_ids:
-            for j in activity_ids: # j is activityID
-                # Check the duration of the activity
-                activity_duration = self.activity_df.loc[self.activity_df["activityID"] == j, "duration"].iloc[0]
-                
-                # If the activity's duration is greater than 1, skip this constraint for this activity
-                if activity_duration > 1:
-                    continue
-
-                for day in days:
-                    # Sum of activity_chosen for this group, activity, on this day (across all periods)
-                    daily_activity_occurrences = []
-                    for period in periods:
-                        time_slot = (day, period)
-                        # Ensure the time slot exists before trying to access activity_chosen
-                        if time_slot in self.time_slots:
-                             daily_activity_occurrences.append(activity_chosen[j, time_slot, g])
-                    
-                    # Only add constraint if there are any occurrences for this day (i.e., list is not empty)
-                    if daily_activity_occurrences:
-                        model.Add(sum(daily_activity_occurrences) <= 1)
+            for j in short_activity_ids:
+                for day_slots in slots_by_day.values():
+                    # activity_chosen for this group and activity across all periods of this day
+                    daily_activity_occurrences = [activity_chosen[j, k, g] for k in day_slots]
+                    model.AddAtMostOne(daily_activity_occurrences)
 
         # Constraint 26: Maximum staffing for activities
         # Each activity cannot have more staff than its maxStaff allows
-        for j in activity_ids:
-            # Get the max staff for this activity from the activity DataFrame
-            max_staff = self.activity_df.loc[
-                self.activity_df["activityID"] == j,
-                "maxStaff"
-            ].values[0]
-
-            for g in group_ids:
-                for k in self.time_slots:
-                    # The number of staff assigned to an activity cannot exceed max_staff
-                    model.Add(staff_count[j, k, g] <= max_staff)
+        # (built into the staff_count domain, so no constraint is needed)
 
         ##############################################
         # Constraint 11A: Waterskiing limited to waterfront slots only
         ##############################################
         for g in group_ids:
             for k in self.time_slots:
-                if k not in self.waterfront_schedule.get(g, []):
+                if k not in waterfront_slots.get(g, frozenset()):
                     # Waterskiing cannot be scheduled outside waterfront periods
-                    model.Add(activity_chosen[waterskiing_id, k, g] == 0)
+                    fixed_to_zero.append(activity_chosen[waterskiing_id, k, g])
 
         ##############################################
         # Constraint 11B: Waterskiing staff daily continuity
         # If a staff member works waterskiing at any waterfront period in a day,
         # they must work ALL waterskiing periods that day (across groups).
         ##############################################
-        days_list_ws = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-
         # Pre-compute waterfront/waterskiing slots by day for easier reference
-        waterski_slots_by_day = {d: [] for d in days_list_ws}
+        waterski_slots_by_day = {d: [] for d in days}
         for g_tmp, slots_tmp in self.waterfront_schedule.items():
             for slot in slots_tmp:
                 waterski_slots_by_day[slot[0]].append((slot, g_tmp))
@@ -840,18 +880,214 @@ class Scheduler:
         # Create helper boolean vars indicating whether a staff member is on waterski duty for a given day
         waterski_staff_day = {}
         for i in staff_ids:
-            for d in days_list_ws:
-                waterski_staff_day[i, d] = model.NewBoolVar(f"waterski_staff_day_{i}_{d}")
+            for d in days:
+                waterski_staff_day[i, d] = model.NewBoolVar(f"waterski_staff_day_{i}_{d}" if debug else '')
 
                 slots_pairs = waterski_slots_by_day[d]
 
                 if slots_pairs:
                     # Link individual waterski period assignments to the day-level boolean
                     for slot_k, grp_tmp in slots_pairs:
-                        model.Add(staff_assign[i, waterskiing_id, slot_k, grp_tmp] == waterski_staff_day[i, d])
+                        model.Add(staff_assign.get((i, waterskiing_id, slot_k, grp_tmp), zero) == waterski_staff_day[i, d])
                 else:
                     # No waterfront on this day – force the boolean to 0
-                    model.Add(waterski_staff_day[i, d] == 0)
+                    fixed_to_zero.append(waterski_staff_day[i, d])
+
+        # Fix every variable collected above to 0. All are Booleans, so a zero
+        # sum forces each one to 0 and presolve removes them.
+        if fixed_to_zero:
+            model.Add(cp_model.LinearExpr.Sum(fixed_to_zero) == 0)
+
+        # Optional solution hint: a previous schedule, or a greedy guess at the weekly
+        # structure of each group's schedule. Hints are only a starting point; the
+        # solver repairs or drops them as needed.
+        if self.warm_start:
+            hinted_assign, hinted_chosen, hinted_inspections = self._warm_start_assignments()
+            for key, var in staff_assign.items():
+                model.AddHint(var, key in hinted_assign)
+            for key, var in activity_chosen.items():
+                model.AddHint(var, key in hinted_chosen)
+            for key, var in inspection_slot.items():
+                model.AddHint(var, key in hinted_inspections)
+            for (g, day), var in driving_range_day.items():
+                model.AddHint(var, (driving_range_id, (day, 1), g) in hinted_chosen)
+            for (k, g), var in golf_tennis_slot.items():
+                model.AddHint(var, (golf_id, k, g) in hinted_chosen and (tennis_id, k, g) in hinted_chosen)
+        elif self.use_greedy_hint:
+            dr_day_by_group, golf_tennis_by_group, inspector_by_slot = self._greedy_initial_assignment()
+            for g, hinted_day in dr_day_by_group.items():
+                for day in self.allowed_dr_days:
+                    model.AddHint(driving_range_day[g, day], day == hinted_day)
+                model.AddHint(activity_chosen[driving_range_id, (hinted_day, 1), g], 1)
+                model.AddHint(activity_chosen[driving_range_id, (hinted_day, 2), g], 1)
+            for g, hinted_slots in golf_tennis_by_group.items():
+                for k in self.time_slots:
+                    model.AddHint(golf_tennis_slot[k, g], k in hinted_slots)
+                for k in hinted_slots:
+                    model.AddHint(activity_chosen[golf_id, k, g], 1)
+                    model.AddHint(activity_chosen[tennis_id, k, g], 1)
+            for k, inspector in inspector_by_slot.items():
+                for i in staff_ids:
+                    model.AddHint(inspection_slot[i, k], i == inspector)
+
+        # Optional search hint: first fix the most constraining Booleans (each group's
+        # driving range day, then cabin inspections and waterski staff days), then branch
+        # on the objective terms, pushing the minimized terms down and the maximized terms
+        # up. Only the worker using the fixed search follows it (a single worker does so
+        # automatically); the rest of the portfolio searches as usual.
+        if self.use_decision_strategy:
+            model.AddDecisionStrategy(
+                list(driving_range_day.values()), cp_model.CHOOSE_FIRST, cp_model.SELECT_MAX_VALUE
+            )
+            model.AddDecisionStrategy(
+                list(inspection_slot.values()), cp_model.CHOOSE_LOWEST_MIN, cp_model.SELECT_MIN_VALUE
+            )
+            model.AddDecisionStrategy(
+                list(waterski_staff_day.values()), cp_model.CHOOSE_LOWEST_MIN, cp_model.SELECT_MIN_VALUE
+            )
+            model.AddDecisionStrategy(
+                [staff_repeated_activities, total_unassigned_periods_deviation],
+                cp_model.CHOOSE_LOWEST_MIN, cp_model.SELECT_MIN_VALUE
+            )
+            model.AddDecisionStrategy(
+                [group_category_variety, total_group_weekly_activity_diversity, total_priority_score],
+                cp_model.CHOOSE_HIGHEST_MAX, cp_model.SELECT_MAX_VALUE
+            )
+
+        # Keep the model and the variables used by the objective and the result extraction
+        self._model = model
+        self._model_vars = {
+            "staff_ids": staff_ids,
+            "activity_ids": activity_ids,
+            "group_ids": group_ids,
+            "driving_range_id": driving_range_id,
+            "valid_locations": valid_locations,
+            "staff_assign": staff_assign,
+            "loc_assign": loc_assign,
+            "inspection_slot": inspection_slot,
+            "driving_range_day": driving_range_day,
+            "driving_range_staff": driving_range_staff,
+            "trip_assign": trip_assign,
+            "max_activity_count": max_activity_count,
+            "optimizable_categories": optimizable_categories,
+            "max_possible_priority_score": max_possible_priority_score,
+            "staff_repeated_activities": staff_repeated_activities,
+            "group_category_variety": group_category_variety,
+            "total_group_weekly_activity_diversity": total_group_weekly_activity_diversity,
+            "total_unassigned_periods_deviation": total_unassigned_periods_deviation,
+            "total_priority_score": total_priority_score,
+        }
+
+    def _greedy_initial_assignment(self):
+        """
+        Greedily picks a driving range day and two golf + tennis slots for every group,
+        and a cabin inspector for every day, for use as a solution hint. Choices avoid
+        the group's waterfront slots, keep each day's driving range and each golf + tennis
+        slot to one group, and never put golf + tennis twice on the same day. Groups with
+        the fewest free driving range days are placed first. Inspectors are the available
+        staff who can lead the fewest activities (the least needed elsewhere), each used
+        at most once. Anything left without a valid choice is not hinted.
+
+        :return: Tuple (dict of group ID -> driving range day,
+                        dict of group ID -> list of golf + tennis time slots,
+                        dict of period 1 time slot -> inspector staff ID)
+        """
+        group_ids = self.group_df["groupID"].tolist()
+        waterfront_slots = {g: set(self.waterfront_schedule.get(g, [])) for g in group_ids}
+
+        # Driving range takes periods 1 and 2, so neither may be a waterfront slot
+        free_dr_days = {
+            g: [day for day in self.allowed_dr_days
+                if (day, 1) not in waterfront_slots[g] and (day, 2) not in waterfront_slots[g]]
+            for g in group_ids
+        }
+
+        dr_day_by_group = {}
+        for g in sorted(group_ids, key=lambda g: len(free_dr_days[g])):
+            for day in free_dr_days[g]:
+                if day not in dr_day_by_group.values():
+                    dr_day_by_group[g] = day
+                    break
+
+        golf_tennis_by_group = {}
+        used_golf_tennis_slots = set()
+        for g in group_ids:
+            blocked = set(waterfront_slots[g])
+            if g in dr_day_by_group:
+                blocked.update([(dr_day_by_group[g], 1), (dr_day_by_group[g], 2)])
+
+            chosen = []
+            for day_slots in self._slots_by_day.values():
+                free = [k for k in day_slots if k not in blocked and k not in used_golf_tennis_slots]
+                if free:
+                    chosen.append(free[0])
+                    if len(chosen) == 2:
+                        break
+            if len(chosen) == 2:
+                golf_tennis_by_group[g] = chosen
+                used_golf_tennis_slots.update(chosen)
+
+        # Staff unavailable in each slot (time off or trips)
+        staff_ids = self.staff_df["staffID"].tolist()
+        unavailable_slots = {
+            i: set(self.staff_off_time_slots.get(i, [])) | {k for k, _ in self.staff_trips.get(i, [])}
+            for i in staff_ids
+        }
+        staff_by_num_leads = sorted(staff_ids, key=lambda i: len(self.leads_mapping.get(i, [])))
+
+        inspector_by_slot = {}
+        for k in self._period1_slots:
+            for i in staff_by_num_leads:
+                if k not in unavailable_slots[i] and i not in inspector_by_slot.values():
+                    inspector_by_slot[k] = i
+                    break
+
+        return dr_day_by_group, golf_tennis_by_group, inspector_by_slot
+
+    def _warm_start_assignments(self):
+        """
+        Converts the warm_start schedule back into model keys, matching staff and
+        activities by name. Trips and entries for unknown staff or activities are skipped.
+
+        :return: Tuple (set of (staffID, activityID, time_slot, groupID) staff assignments,
+                        set of (activityID, time_slot, groupID) chosen activities,
+                        set of (staffID, time_slot) inspections)
+        """
+        staff_id_by_name = self._staff_id_by_name
+        activity_id_by_name = self._activity_id_by_name
+
+        hinted_assign = set()
+        hinted_chosen = set()
+        hinted_inspections = set()
+        for entry in self.warm_start:
+            k = tuple(entry["time_slot"])
+            names = entry["staff"]
+            if isinstance(names, str):
+                names = [names]
+            entry_staff_ids = [staff_id_by_name[name] for name in names if name in staff_id_by_name]
+
+            if entry["activity"] == "inspection":
+                hinted_inspections.update((i, k) for i in entry_staff_ids)
+            elif entry["activity"] in activity_id_by_name and entry["group"] != "NA":
+                j = activity_id_by_name[entry["activity"]]
+                g = entry["group"]
+                hinted_chosen.add((j, k, g))
+                hinted_assign.update((i, j, k, g) for i in entry_staff_ids)
+
+        return hinted_assign, hinted_chosen, hinted_inspections
+
+    def _set_objective(self):
+        """
+        Sets the weighted objective on the built model from the current optimization weights.
+        Replaces any objective set by a previous call.
+        """
+        model = self._model
+        mv = self._model_vars
+        staff_ids = mv["staff_ids"]
+        activity_ids = mv["activity_ids"]
+        group_ids = mv["group_ids"]
+        max_activity_count = mv["max_activity_count"]
+        optimizable_categories = mv["optimizable_categories"]
 
         # OBJECTIVE FUNCTION:
         # Combine all optimization objectives with weights
@@ -877,9 +1113,7 @@ class Scheduler:
         
         # 2) Group category variety – best case equals the total
         #    number of (group, day, period, category) combinations
-        optim_var_days = list(set(k[0] for k in self.time_slots))
-        optim_var_periods = list(set(k[1] for k in self.time_slots))
-        max_group_category_variety = len(group_ids) * len(optim_var_days) * len(optim_var_periods) * len(optimizable_categories)
+        max_group_category_variety = len(group_ids) * len(self.time_slots) * len(optimizable_categories)
         
         # 3) Weekly activity diversity per group
         max_group_weekly_activity_diversity = len(group_ids) * len(activity_ids)
@@ -890,7 +1124,7 @@ class Scheduler:
         
         # 5) Priority lead assignment score – best case is every
         #    possible prioritized assignment is fulfilled.
-        max_priority_score = max_possible_priority_score if 'max_possible_priority_score' in locals() else 0
+        max_priority_score = mv["max_possible_priority_score"]
         
         # Guard against divide-by-zero just in case
         def _safe_div(weight, denom):
@@ -904,25 +1138,106 @@ class Scheduler:
         
         # Build the normalized objective function.  Remember that
         # CP-SAT minimises, so we negate terms we wish to *maximise*.
-        model.Minimize(
-            norm_w_staff_diversity * staff_repeated_activities -
-            norm_w_group_diversity * group_category_variety -
-            norm_w_group_weekly_diversity * total_group_weekly_activity_diversity +
-            norm_w_unassigned_balance * total_unassigned_periods_deviation -
-            norm_w_lead_priority * total_priority_score
-        )
+        model.Minimize(cp_model.LinearExpr.WeightedSum(
+            [
+                mv["staff_repeated_activities"],
+                mv["group_category_variety"],
+                mv["total_group_weekly_activity_diversity"],
+                mv["total_unassigned_periods_deviation"],
+                mv["total_priority_score"],
+            ],
+            [
+                norm_w_staff_diversity,
+                -norm_w_group_diversity,
+                -norm_w_group_weekly_diversity,
+                norm_w_unassigned_balance,
+                -norm_w_lead_priority,
+            ]
+        ))
+
+    def _make_solver(self):
+        """
+        Creates a CP-SAT solver configured from the time limit and the scheduler's solver settings.
 
-        # Solve the constraint programming model
+        :return: The configured cp_model.CpSolver
+        """
         solver = cp_model.CpSolver()
-        
+
         # Set a time limit (in seconds) to prevent the solver from running indefinitely
         solver.parameters.max_time_in_seconds = SOLVER_TIME_LIMIT * 60  # Convert to seconds
+
+        # Run the search portfolio in parallel across the available cores
+        solver.parameters.num_workers = self.num_workers
+
+        # Fix the seed if requested so repeated runs explore the search the same way
+        if self.random_seed is not None:
+            solver.parameters.random_seed = self.random_seed
+        
+        # Detailed CP-SAT logging is off by default; basic progress is shown by the callback in solve().
+        # When enabled, the solver's own log is printed and no Python callback is needed.
+        solver.parameters.log_search_progress = self.log_search_progress
+        if self.log_search_progress:
+            solver.parameters.log_to_stdout = False
+            solver.log_callback = print
+
+        # Use the full LP relaxation. The model is mostly at-most-one and cardinality
+        # constraints over Booleans, where it finds much better schedules early on.
+        solver.parameters.linearization_level = 2
+
+        # Extra solver parameters for tuning experiments (names as in CP-SAT's SatParameters).
+        # The defaults already use symmetry level 2 and probing level 2.
+        # Repeated fields (e.g. 'subsolvers') take a list and can't be assigned directly.
+        for name, value in self.solver_parameters.items():
+            if isinstance(value, (list, tuple)):
+                field = getattr(solver.parameters, name)
+                del field[:]
+                field.extend(value)
+            else:
+                setattr(solver.parameters, name, value)
+
+        return solver
+
+    def solve(self):
+        """
+        Builds and solves the constraint satisfaction problem for camp scheduling.
+        Returns a complete schedule if a feasible solution is found.
         
-        # Disable detailed logging but show basic progress
-        solver.parameters.log_search_progress = False
+        The model is built on the first call and reused afterwards, so the schedule can be
+        re-solved with different optimization_weights without rebuilding the constraints.
         
+        :return: List of dictionaries containing schedule entries
+        :raises: ValueError if no feasible solution is found
+        """
+        # Build the model once; the constraints only depend on the camp data
+        if self._model is None:
+            self._build_model()
+        model = self._model
+        self._set_objective()
+
+        # Variables needed to report metrics and extract the schedule
+        mv = self._model_vars
+        staff_ids = mv["staff_ids"]
+        activity_ids = mv["activity_ids"]
+        group_ids = mv["group_ids"]
+        driving_range_id = mv["driving_range_id"]
+        valid_locations = mv["valid_locations"]
+        staff_assign = mv["staff_assign"]
+        loc_assign = mv["loc_assign"]
+        inspection_slot = mv["inspection_slot"]
+        driving_range_day = mv["driving_range_day"]
+        driving_range_staff = mv["driving_range_staff"]
+        staff_repeated_activities = mv["staff_repeated_activities"]
+        group_category_variety = mv["group_category_variety"]
+        total_group_weekly_activity_diversity = mv["total_group_weekly_activity_diversity"]
+        total_unassigned_periods_deviation = mv["total_unassigned_periods_deviation"]
+        total_priority_score = mv["total_priority_score"]
+
+        # Solve the constraint programming model
+        solver = self._make_solver()
+
         print("Solving optimization problem...")
         print(f"Time limit set to {solver.parameters.max_time_in_seconds/60} minutes")
+        print(f"Using {self.num_workers} search worker(s)")
         
         # Create a simple progress callback
         class SolutionCallback(cp_model.CpSolverSolutionCallback):
@@ -931,18 +1246,19 @@ class Scheduler:
             def __init__(self):
                 cp_model.CpSolverSolutionCallback.__init__(self)
                 self._solution_count = 0
-                self._start_time = time.time()
+                self._start_time = time.monotonic()
                 
             def on_solution_callback(self):
                 """Called on each new solution."""
-                current_time = time.time()
-                obj = self.ObjectiveValue()
                 self._solution_count += 1
-                if self._solution_count % 10 == 0:  # Only print every 50th solution
-                    print(f"  Solution {self._solution_count} | Objective: {obj} | Time: {current_time - self._start_time:.1f}s")
+                if self._solution_count % 10 == 0:  # Only print every 10th solution
+                    print(f"  Solution {self._solution_count} | Objective: {self.ObjectiveValue()} | Time: {time.monotonic() - self._start_time:.1f}s")
         
-        callback = SolutionCallback()
-        status = solver.Solve(model, callback)
+        if self.log_search_progress:
+            status = solver.Solve(model)
+        else:
+            callback = SolutionCallback()
+            status = solver.Solve(model, callback)
         
         # Report solver status
         print("\nSolver completed with status:", end=" ")
@@ -977,6 +1293,22 @@ class Scheduler:
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
             schedule = []
 
+            # ID -> name lookups for staff, activities and locations (built once in __init__)
+            staff_name = self._staff_name_by_id
+            activity_name_by_id = self._activity_name_by_id
+            location_name_by_id = self._location_name_by_id
+
+            # Read the whole solution once and index it by variable, instead of crossing
+            # into the solver with a solver.Value() call for every variable
+            solution = solver.ResponseProto().solution
+
+            # Collect the staff assigned to each (activity, time slot, group) in a single
+            # pass over the staff assignment variables (staff stay in staff_ids order)
+            staff_by_cell = defaultdict(list)
+            for (i, j, k, g), var in staff_assign.items():
+                if solution[var.Index()] == 1:
+                    staff_by_cell[j, k, g].append(i)
+
             # Process the solution to build a readable schedule
             for g in group_ids:
                 for j in activity_ids:
@@ -984,35 +1316,25 @@ class Scheduler:
                     if j == driving_range_id:
                         continue
                     for k in self.time_slots:
-                        # Collect all staff assigned to this activity, time slot, and group
-                        assigned_staff_ids = [i for i in staff_ids if solver.Value(staff_assign[i, j, k, g]) == 1]
+                        # All staff assigned to this activity, time slot, and group
+                        assigned_staff_ids = staff_by_cell.get((j, k, g))
 
                         # Only process activities that have staff assigned to them
                         if assigned_staff_ids:
                             # Find the assigned location for this activity
+                            # (Constraint 4 guarantees it is one of the activity's valid locations)
                             assigned_location = None
-                            for l in location_ids:
-                                if solver.Value(loc_assign[l, j, k, g]) == 1:
+                            for l in valid_locations[j]:
+                                if solution[loc_assign[l, j, k, g].Index()] == 1:
                                     assigned_location = l
                                     break
 
                             # Convert staff IDs to staff names
-                            assigned_staff_names = []
-                            for i in assigned_staff_ids:
-                                name = self.staff_df.loc[
-                                    self.staff_df["staffID"] == i, "staffName"
-                                ].values[0]
-                                assigned_staff_names.append(name)
+                            assigned_staff_names = [staff_name[i] for i in assigned_staff_ids]
 
                             # Convert IDs to activity/location names
-                            activity_name = self.activity_df.loc[
-                                self.activity_df["activityID"] == j,
-                                "activityName"
-                            ].values[0]
-                            location_name = self.location_df.loc[
-                                self.location_df["locID"] == assigned_location,
-                                "locName"
-                            ].values[0]
+                            activity_name = activity_name_by_id[j]
+                            location_name = location_name_by_id[assigned_location]
 
                             # Add this activity to the schedule
                             schedule.append({
@@ -1027,49 +1349,42 @@ class Scheduler:
             for g in group_ids:
                 for day in self.allowed_dr_days:
                     # Check if driving range is scheduled for this group and day
-                    if solver.Value(driving_range_day[g, day]) == 1:
+                    if solution[driving_range_day[g, day].Index()] == 1:
                         k1 = (day, 1)  # Period 1
                         k2 = (day, 2)  # Period 2
 
                         # Find staff assigned to driving range
                         assigned_staff_ids = [
                             i for i in staff_ids
-                            if solver.Value(driving_range_staff[g, day, i]) == 1
+                            if solution[driving_range_staff[g, day, i].Index()] == 1
                         ]
 
                         if assigned_staff_ids:
-                            # Get staff names
-                            for i in assigned_staff_ids:
-                                names = self.staff_df.loc[
-                                    self.staff_df["staffID"] == i,
-                                    "staffName"
-                                ].values[0]
+                            # Get the names of all assigned staff
+                            names = [staff_name[i] for i in assigned_staff_ids]
 
                             # Add driving range to schedule for both periods
                             schedule.append({
                                 "activity": "driving range",
-                                "staff": [names],
+                                "staff": names,
                                 "location": "driving range",
                                 "time_slot": k1,
                                 "group": g
                             })
                             schedule.append({
                                 "activity": "driving range",
-                                "staff": [names],
+                                "staff": names,
                                 "location": "driving range",
                                 "time_slot": k2,
                                 "group": g
                             })
 
             # Extract inspection assignments
-            for k in inspection_slots:
-                assigned_inspection_id = [i for i in staff_ids if solver.Value(inspection_slot[i,k]) == 1]
+            for k in self._period1_slots:
+                assigned_inspection_id = [i for i in staff_ids if solution[inspection_slot[i,k].Index()] == 1]
                 if assigned_inspection_id:
                     # Get the name of the staff assigned to inspection
-                    name = self.staff_df.loc[
-                        self.staff_df["staffID"] == assigned_inspection_id[0],
-                        "staffName"
-                    ].values[0]
+                    name = staff_name[assigned_inspection_id[0]]
 
                     # Add inspection to the schedule
                     schedule.append({
@@ -1080,44 +1395,19 @@ class Scheduler:
                         "group": "NA"
                     })
 
-            # Extract trip assignments
-            trip_assignments = {}  # Maps (trip_name, slot) to list of staff IDs
-
-            # Collect staff for each trip
+            # Extract trip assignments. Constraint 23 fixes every trip assignment to 1,
+            # so the trips come straight from the input without reading the solver.
+            trip_assignments = defaultdict(list)  # Maps (trip_name, slot) to list of staff IDs
             for i in staff_ids:
-                if i not in self.staff_trips:
-                    continue
-                trips_for_staff = self.staff_trips.get(i, [])
-                for (slot, trip_name) in trips_for_staff:
-                    key = (trip_name, slot)
-                    if key not in trip_assignments:
-                        trip_assignments[key] = []
-                    trip_assignments[key].append(i)
-
-            # Organize trip staff into a dictionary by trip and time slot
-            trip_rows = {}
-            for (trip_name, k), staff_list in trip_assignments.items():
-                for i in staff_list:
-                    if solver.Value(trip_assign[i,k,trip_name]) == 1:
-                        if (trip_name, k) not in trip_rows:
-                            trip_rows[(trip_name, k)] = []
-                        trip_rows[(trip_name, k)].append(i)
+                for (slot, trip_name) in self.staff_trips.get(i, []):
+                    trip_assignments[trip_name, slot].append(i)
 
             # Create schedule entries for trips
-            for (trip_name, k), staff_ids in trip_rows.items():
-                # Convert staff IDs to names
-                staff_names = []
-                for i in staff_ids:
-                    name = self.staff_df.loc[
-                        self.staff_df["staffID"] == i,
-                        "staffName"
-                    ].values[0]
-                    staff_names.append(name)
-                
+            for (trip_name, k), trip_staff_ids in trip_assignments.items():
                 # Add trip to the schedule
                 schedule.append({
                     "activity": trip_name,
-                    "staff": staff_names,
+                    "staff": [staff_name[i] for i in trip_staff_ids],
                     "location": "NA",
                     "time_slot": k,
                     "group": "NA"
@@ -1139,9 +1429,6 @@ def generate_staff_schedule_csv(schedule_df, staff_df, time_slots, staff_off_tim
     output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'staff_schedules')
     os.makedirs(output_dir, exist_ok=True)
 
-    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-    periods = [1, 2, 3]
-    
     staff_list = staff_df[['staffID', 'staffName']].to_dict('records')
 
     # Explode schedule_df to handle multiple staff per activity
@@ -1150,6 +1437,15 @@ def generate_staff_schedule_csv(schedule_df, staff_df, time_slots, staff_off_tim
     else:
         schedule_df_exploded = schedule_df
 
+    # Activity shown for each (staff, time slot): the first scheduled entry, with
+    # volleyball renamed to newcomb for groups 1 and 2
+    first_entries = schedule_df_exploded.drop_duplicates(subset=['staff', 'time_slot'], keep='first')
+    is_newcomb = (
+        (first_entries['activity'].astype(str).str.lower() == 'volleyball') & first_entries['group'].isin([1, 2])
+    )
+    shown_activity = first_entries['activity'].where(~is_newcomb, 'newcomb')
+    activity_by_staff_slot = dict(zip(zip(first_entries['staff'], first_entries['time_slot']), shown_activity))
+
     data = []
     for staff_info in staff_list:
         staff_id = staff_info['staffID']
@@ -1160,42 +1456,29 @@ def generate_staff_schedule_csv(schedule_df, staff_df, time_slots, staff_off_tim
         # Get staff's off slots
         off_slots = set(staff_off_time_slots.get(staff_id, []))
 
-        for period in periods:
+        for period in PERIODS:
             row_data = {'Staff': staff_name if period == 1 else ''}
             
-            for day in days:
+            for day in DAYS:
                 time_slot = (day, period)
                 
                 activity = '' # Default to blank
                 if time_slot not in off_slots:
-                    # Find activity for this staff, day, period
-                    activity_info = schedule_df_exploded[
-                        (schedule_df_exploded['staff'] == staff_name) &
-                        (schedule_df_exploded['time_slot'] == time_slot)
-                    ]
-                    
-                    if not activity_info.empty:
-                        activity_name = activity_info['activity'].iloc[0]
-                        group = activity_info['group'].iloc[0]
-                        
-                        # Rename volleyball to newcomb for groups 1 and 2
-                        if str(activity_name).lower() == 'volleyball' and group in [1, 2]:
-                            activity = 'newcomb'
-                        else:
-                            activity = activity_name
+                    # Activity for this staff, day, period (if any)
+                    activity = activity_by_staff_slot.get((staff_name, time_slot), '')
                 
                 row_data[day] = activity
             staff_schedule_rows.append(row_data)
         
         data.extend(staff_schedule_rows)
         # Add a blank row for line break, matching the requested format
-        data.append({day: '' for day in ['Staff'] + days})
+        data.append({day: '' for day in ['Staff'] + DAYS})
 
     # Create DataFrame and save to CSV
     if data:
         # Remove the last empty row
         data.pop()
-        staff_schedule_df = pd.DataFrame(data, columns=['Staff'] + days)
+        staff_schedule_df = pd.DataFrame(data, columns=['Staff'] + DAYS)
         staff_schedule_df.to_csv(os.path.join(output_dir, "staff_schedule.csv"), index=False)
 
 def generate_unassigned_staff_csv(schedule_df, staff_df, time_slots, staff_off_time_slots, staff_trips):
@@ -1211,47 +1494,47 @@ def generate_unassigned_staff_csv(schedule_df, staff_df, time_slots, staff_off_t
     output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'staff_schedules')
     os.makedirs(output_dir, exist_ok=True)
 
-    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-    periods = [1, 2, 3]
-    
     # Create a DataFrame with periods as rows and days as columns
-    unassigned_df = pd.DataFrame(index=periods, columns=days)
+    unassigned_df = pd.DataFrame(index=PERIODS, columns=DAYS)
     
+    # Index staff names by ID once for constant-time lookups in the loop below
+    staff_name_by_id = staff_df.set_index('staffID')['staffName']
+    all_staff_names = set(staff_name_by_id.tolist())
+
     # Explode schedule_df to handle multiple staff per activity
     if 'staff' in schedule_df.columns and schedule_df['staff'].apply(lambda x: isinstance(x, list)).any():
         schedule_df_exploded = schedule_df.explode('staff')
     else:
         schedule_df_exploded = schedule_df
 
+    # Staff who are off, on trips, or assigned to activities in each time slot,
+    # each gathered in a single pass
+    off_staff_by_slot = defaultdict(set)
+    for staff_id, off_slots in staff_off_time_slots.items():
+        for slot in off_slots:
+            off_staff_by_slot[slot].add(staff_name_by_id.at[staff_id])
+
+    trip_staff_by_slot = defaultdict(set)
+    for staff_id, trips in staff_trips.items():
+        for slot, _ in trips:
+            trip_staff_by_slot[slot].add(staff_name_by_id.at[staff_id])
+
+    assigned_staff_by_slot = defaultdict(set)
+    for slot, staff_name in zip(schedule_df_exploded['time_slot'], schedule_df_exploded['staff']):
+        assigned_staff_by_slot[slot].add(staff_name)
+
     # For each time slot, find unassigned staff
-    for day in days:
-        for period in periods:
+    for day in DAYS:
+        for period in PERIODS:
             time_slot = (day, period)
             
-            # Get all staff names
-            all_staff = set(staff_df['staffName'].tolist())
-            
-            # Remove staff who are off
-            off_staff = set()
-            for staff_id, off_slots in staff_off_time_slots.items():
-                if time_slot in off_slots:
-                    staff_name = staff_df.loc[staff_df['staffID'] == staff_id, 'staffName'].iloc[0]
-                    off_staff.add(staff_name)
-            
-            # Remove staff who are on trips
-            trip_staff = set()
-            for staff_id, trips in staff_trips.items():
-                if any(slot == time_slot for slot, _ in trips):
-                    staff_name = staff_df.loc[staff_df['staffID'] == staff_id, 'staffName'].iloc[0]
-                    trip_staff.add(staff_name)
-            
-            # Remove staff who are assigned to activities
-            assigned_staff = set(schedule_df_exploded[
-                schedule_df_exploded['time_slot'] == time_slot
-            ]['staff'].tolist())
+            # Remove staff who are off, on trips, or assigned to activities
+            off_staff = off_staff_by_slot[time_slot]
+            trip_staff = trip_staff_by_slot[time_slot]
+            assigned_staff = assigned_staff_by_slot[time_slot]
             
             # Calculate unassigned staff
-            unassigned_staff = all_staff - off_staff - trip_staff - assigned_staff
+            unassigned_staff = all_staff_names - off_staff - trip_staff - assigned_staff
             
             # Sort staff names for consistent output
             unassigned_staff = sorted(list(unassigned_staff))
@@ -1272,44 +1555,40 @@ def generate_group_schedules_csv(schedule_df, group_ids):
     output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'group_schedules')
     os.makedirs(output_dir, exist_ok=True)
 
-    # Prepare day and period lists
-    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-    periods = [1, 2, 3]
+    # Groups to write, plus the "NA" entries (inspection, trips)
     all_groups = group_ids + ["NA"]
 
-    for group in all_groups:
-        # Filter schedule for this group
-        group_sched = schedule_df[schedule_df['group'] == group]
-        # Build a DataFrame with periods as rows, days as columns
-        sched_matrix = pd.DataFrame(index=periods, columns=days)
-        for day in days:
-            for period in periods:
-                # Find all activities for this group, day, period
-                slot_activities = group_sched[group_sched['time_slot'] == (day, period)]
-                
-                acts = []
-                for _, row in slot_activities.iterrows():
-                    activity_name = row['activity']
-                    location_name = row['location']
-
-                    # Rename volleyball to newcomb for groups 1 and 2
-                    if group in [1, 2] and str(activity_name).lower() == 'volleyball':
-                        activity_name = 'newcomb'
+    # Display name for every row: rename volleyball to newcomb for groups 1 and 2, and
+    # append location abbreviations for Upper D / Lower D (except golf on Lower D)
+    activity_lower = schedule_df['activity'].astype(str).str.lower()
+    location_lower = schedule_df['location'].astype(str).str.lower()
+    display = schedule_df['activity'].where(
+        ~(schedule_df['group'].isin([1, 2]) & (activity_lower == 'volleyball')), 'newcomb'
+    ).astype(str)
+    display = display.mask(location_lower == 'upper d', display + " (UD)")
+    display = display.mask((location_lower == 'lower d') & (display.str.lower() != 'golf'), display + " (LD)")
+
+    # Filter out "waterskiing" so it does not appear on group schedules
+    slots = schedule_df['time_slot'].astype(object)
+    entries = pd.DataFrame({
+        'group': schedule_df['group'],
+        'day': slots.str[0],
+        'period': slots.str[1],
+        'display': display,
+    })[activity_lower != 'waterskiing']
+
+    # One groupby for all groups: activity names per (group, period, day), joined with newlines
+    joined = entries.groupby(['group', 'period', 'day'], sort=False)['display'].agg('\n'.join)
+    by_group = {group: cells.droplevel('group') for group, cells in joined.groupby(level='group', sort=False)}
 
-                    # Filter out "waterskiing" so it does not appear on group schedules
-                    if str(activity_name).lower() == 'waterskiing':
-                        continue
-                    
-                    # Append location abbreviation for specific locations
-                    if str(location_name).lower() == 'upper d':
-                        activity_name = f"{activity_name} (UD)"
-                    elif str(location_name).lower() == 'lower d' and str(activity_name).lower() != 'golf':
-                        activity_name = f"{activity_name} (LD)"
-                    
-                    acts.append(activity_name)
-
-                # Join activity names with newlines if multiple
-                sched_matrix.at[period, day] = '\n'.join(acts) if acts else ''
+    for group in all_groups:
+        # Periods as rows, days as columns; empty cells for slots with no activities
+        cells = by_group.get(group)
+        if cells is None:
+            sched_matrix = pd.DataFrame('', index=PERIODS, columns=DAYS)
+        else:
+            sched_matrix = cells.unstack('day').reindex(index=PERIODS, columns=DAYS).fillna('')
+            sched_matrix = sched_matrix.rename_axis(index=None, columns=None)
         # Save to CSV
         group_name = f"group_{group}" if group != "NA" else "special_NA"
         sched_matrix.to_csv(os.path.join(output_dir, f"{group_name}_schedule.csv"))
@@ -1335,8 +1614,8 @@ if __name__ == "__main__":
     assists_df = manager.get_dataframe("assists")
 
     # Create leads and assists mapping
-    leads_mapping = leads_df.groupby('staffID')['activityID'].apply(list).to_dict()
-    assists_mapping = assists_df.groupby('staffID')['activityID'].apply(list).to_dict()
+    leads_mapping = group_values_by_key(leads_df, 'staffID', 'activityID')
+    assists_mapping = group_values_by_key(assists_df, 'staffID', 'activityID')
 
     # Build lead priority mapping: (staffID, activityID) -> priority (converted to int, default 0)
     if 'priority' in leads_df.columns:
@@ -1345,27 +1624,22 @@ if __name__ == "__main__":
         leads_priority = {}
 
     # Map dates to time slots for off_days and trips_ooc
-    off_days = off_days_df.groupby("staffID")["date"].apply(list).to_dict()
+    off_days = group_values_by_key(off_days_df, "staffID", "date")
     staff_off_time_slots = {
-        staff_id: map_dates_to_time_slots(dates)
+        staff_id: map_dates_to_time_slots(tuple(dates))
         for staff_id, dates in off_days.items()
     }
 
     # Extract trip assignments mapping staff to trips
     staff_trips = {}
 
-    for idx, row in trips_df.iterrows():
-        staff_id = row["staffID"]
-        trip_name = row["trip_name"]
-        date_str = row["date"] # in MM/DD/YYYY
-        start_period = row["start_period"]
-        end_period = row["end_period"]
-
-        # Convert date_str --> day_of_week (e.g. "Monday")
-        date_dt = datetime.strptime(date_str, "%m/%d/%Y")
-        dow_number = date_dt.weekday()
-        dow_name = calendar.day_name[dow_number]
+    # Convert all trip dates (MM/DD/YYYY) to day-of-week names (e.g. "Monday") at once
+    trip_day_names = pd.to_datetime(trips_df["date"], format="%m/%d/%Y").dt.day_name().tolist()
 
+    for staff_id, trip_name, dow_name, start_period, end_period in zip(
+        trips_df["staffID"].tolist(), trips_df["trip_name"].tolist(), trip_day_names,
+        trips_df["start_period"].tolist(), trips_df["end_period"].tolist()
+    ):
         # Build partial-day time slots
         trip_slots = [(dow_name, p) for p in range(start_period, end_period+1)]
 
@@ -1409,9 +1683,17 @@ if __name__ == "__main__":
     # Define optimization weights
     optimization_weights = OPTIMIZATION_WEIGHTS  # Use imported weights
 
+    # The last successful schedule is saved here, and can seed the next run's search
+    last_schedule_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'last_schedule.pkl')
+    warm_start = None
+    if WARM_START_FROM_LAST_SCHEDULE and os.path.exists(last_schedule_path):
+        print("Starting the search from the last saved schedule")
+        warm_start = pd.read_pickle(last_schedule_path).to_dict('records')
+
     scheduler = Scheduler(staff_df, activity_df, location_df, location_options_df, group_df, time_slots,
                           staff_off_time_slots, leads_mapping, assists_mapping, waterfront_schedule, 
-                          allowed_dr_days, staff_trips, optimization_weights, leads_priority)
+                          allowed_dr_days, staff_trips, optimization_weights, leads_priority,
+                          num_workers=NUM_SEARCH_WORKERS, warm_start=warm_start)
     try:
         schedule = scheduler.solve()
 
@@ -1425,29 +1707,35 @@ if __name__ == "__main__":
 
         # Print sorted schedule by time slot
         print("Optimized Schedule:")
-        for time_slot in time_slots:
-            time_slot_df = sorted_schedule[sorted_schedule['time_slot'] == time_slot]
-            if not time_slot_df.empty:
-                print(f"\nTime Slot: {time_slot[0]}, Period: {time_slot[1]}")
-                for _, row in time_slot_df.iterrows():
-                    print(
-                        f" Group: {row['group']}, "
-                        f"Activity: {row['activity']}, "
-                        f"Staff: {row['staff']}, "
-                        f"Location: {row['location']}"
-                    )
+        lines = []
+        for time_slot, time_slot_df in sorted_schedule.groupby('time_slot', observed=True, sort=True):
+            lines.append(f"\nTime Slot: {time_slot[0]}, Period: {time_slot[1]}")
+            for row in time_slot_df.itertuples(index=False):
+                lines.append(
+                    f" Group: {row.group}, "
+                    f"Activity: {row.activity}, "
+                    f"Staff: {row.staff}, "
+                    f"Location: {row.location}"
+                )
+        print("\n".join(lines))
+
+        # One row per assigned staff member, shared by the staff CSVs and the tests
+        exploded_schedule_df = schedule_df.explode('staff')
 
         # Generate all schedule CSV files
         generate_group_schedules_csv(schedule_df.copy(), group_ids)
-        generate_staff_schedule_csv(schedule_df.copy(), staff_df, time_slots, staff_off_time_slots)
-        generate_unassigned_staff_csv(schedule_df.copy(), staff_df, time_slots, staff_off_time_slots, staff_trips)
+        generate_staff_schedule_csv(exploded_schedule_df.copy(), staff_df, time_slots, staff_off_time_slots)
+        generate_unassigned_staff_csv(exploded_schedule_df.copy(), staff_df, time_slots, staff_off_time_slots, staff_trips)
 
         # Run tests on schedule
-        schedule_df = schedule_df.explode('staff')
-        run_tests(schedule_df, group_ids, location_options_df, staff_off_time_slots, 
-                  staff_df, activity_df, leads_mapping, assists_mapping, 
-                  waterfront_schedule, inspection_slots, allowed_dr_days,
-                  time_slots, staff_trips=staff_trips, trips_df=trips_df, leads_df=leads_df)
+        all_tests_passed = run_tests(exploded_schedule_df, group_ids, location_options_df, staff_off_time_slots, 
+                                     staff_df, activity_df, leads_mapping, assists_mapping, 
+                                     waterfront_schedule, inspection_slots, allowed_dr_days,
+                                     time_slots, staff_trips=staff_trips, trips_df=trips_df, leads_df=leads_df)
+
+        # Save the schedule as the next run's warm start, only once it passed every check
+        if all_tests_passed:
+            schedule_df.to_pickle(last_schedule_path)
 
     except ValueError as e:
         print(f"Error: {e}")